@@ -4,7 +4,9 @@ Part of Phase 3, Module 3: The Manual Evaluation Engine
 """
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi.responses import JSONResponse
 from typing import List
+import asyncio
 import logging
 
 from core import database
@@ -25,11 +27,24 @@ router = APIRouter(
     tags=["Evaluations"]
 )
 
+# Maximum time POST /evaluations?wait=true holds the connection open
+EVALUATION_WAIT_TIMEOUT = 30  # seconds
 
-@router.post("", response_model=EvaluationStatusResponse, status_code=202)
+# Strong references to evaluations started inline, so a timed-out wait
+# doesn't let the event loop garbage-collect the still-running task
+_inline_evaluations = set()
+
+
+@router.post(
+    "",
+    response_model=EvaluationStatusResponse,
+    status_code=202,
+    responses={200: {"model": EvaluationResponse, "description": "Evaluation finished within a wait=true request"}}
+)
 async def create_evaluation(
     evaluation_request: EvaluationCreate,
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    wait: bool = False
 ):
     """
     Start a new evaluation run (asynchronous)
@@ -43,11 +58,18 @@ async def create_evaluation(
     The endpoint returns immediately with a 202 Accepted response.
     Use the polling endpoint GET /evaluations/{result_id} to check status.
     
+    With wait=true the request is held open (up to EVALUATION_WAIT_TIMEOUT
+    seconds) until the evaluation finishes, and the complete evaluation is
+    returned with 200 OK. If the timeout is reached the evaluation keeps
+    running and the usual 202 response is returned for polling.
+    
     - **prompt_id**: ID of the agent prompt to test
     - **scenario_id**: ID of the scenario to test against
+    - **wait**: Hold the request open until the evaluation finishes (default: false)
     
     Returns:
-        EvaluationStatusResponse with result_id and initial status (PENDING)
+        EvaluationStatusResponse with result_id and current status,
+        or the full EvaluationResponse when waited on to completion
     """
     try:
         # Validate that prompt and scenario exist
@@ -74,17 +96,45 @@ async def create_evaluation(
         
         logger.info(f"Created evaluation {result_id} for prompt {evaluation_request.prompt_id} and scenario {evaluation_request.scenario_id}")
         
-        # Trigger background task to perform the evaluation
-        background_tasks.add_task(
-            perform_full_evaluation,
+        if not wait:
+            # Trigger background task to perform the evaluation
+            background_tasks.add_task(
+                perform_full_evaluation,
+                result_id=result_id,
+                prompt_id=evaluation_request.prompt_id,
+                scenario_id=evaluation_request.scenario_id
+            )
+            
+            return EvaluationStatusResponse(
+                result_id=result_id,
+                status=EvaluationStatus.PENDING
+            )
+        
+        # Run the evaluation inline; shield it so a timed-out wait doesn't cancel it
+        evaluation_task = asyncio.create_task(perform_full_evaluation(
             result_id=result_id,
             prompt_id=evaluation_request.prompt_id,
             scenario_id=evaluation_request.scenario_id
-        )
+        ))
+        _inline_evaluations.add(evaluation_task)
+        evaluation_task.add_done_callback(_inline_evaluations.discard)
+        
+        try:
+            await asyncio.wait_for(asyncio.shield(evaluation_task), timeout=EVALUATION_WAIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.info(f"Evaluation {result_id} still running after {EVALUATION_WAIT_TIMEOUT}s, falling back to polling")
+        
+        evaluation = await database.get_evaluation_by_id(result_id)
+        
+        if evaluation_task.done():
+            return JSONResponse(
+                status_code=200,
+                content=EvaluationResponse(**evaluation).model_dump(mode="json", by_alias=True)
+            )
         
         return EvaluationStatusResponse(
             result_id=result_id,
-            status=EvaluationStatus.PENDING
+            status=evaluation["status"]
         )
     
     except HTTPException:
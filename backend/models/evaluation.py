@@ -29,6 +29,11 @@ class TranscriptMessage(BaseModel):
         description="The text content of the message",
         example="Hello, I'm calling regarding an outstanding balance on your account."
     )
+    
+    class Config:
+        # Immutable two-field record, built once per turn and never edited
+        extra = "forbid"
+        frozen = True
 
 
 class EvaluationScores(BaseModel):
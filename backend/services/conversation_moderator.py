@@ -289,9 +289,4 @@ def format_transcript_for_evaluation(transcript: List[TranscriptMessage]) -> str
         DEBTOR: I don't have the money right now.
         AGENT: I understand. Can we discuss a payment plan?
     """
-    formatted_lines = []
-    for msg in transcript:
-        speaker_label = msg.speaker.upper()
-        formatted_lines.append(f"{speaker_label}: {msg.message}")
-    
-    return "\n".join(formatted_lines)
+    return "\n".join(f"{msg.speaker.upper()}: {msg.message}" for msg in transcript)
@@ -4,17 +4,21 @@ Analyzes conversation transcripts and provides quantitative scores and qualitati
 Implements the evaluator bot logic as defined in the PRD
 """
 
-import json
+import functools
+import orjson
 from typing import Dict, Tuple
 from google import genai
 from models.evaluation import TranscriptMessage, EvaluationScores
 from core.gemini_client import generate_structured_content, create_schema
 
 
+@functools.lru_cache(maxsize=1)
 def create_evaluation_schema():
     """
     Create the JSON schema for evaluation scoring output
     
+    The schema is static, so it is built once and reused for every evaluation.
+    
     Returns:
         genai.types.Schema: The schema object for structured evaluation output
     """
@@ -35,28 +39,24 @@ def create_evaluation_schema():
     )
 
 
+def _format_line(msg) -> str:
+    """Format one transcript message, given as a TranscriptMessage or a dict"""
+    if isinstance(msg, TranscriptMessage):
+        return f"{msg.speaker.upper()}: {msg.message}"
+    return f"{msg.get('speaker', 'unknown').upper()}: {msg.get('message', '')}"
+
+
 def format_transcript_for_evaluation(transcript: list) -> str:
     """
     Format the transcript into a readable text format
     
     Args:
-        transcript: List of TranscriptMessage objects or dicts
+        transcript: List of TranscriptMessage objects or list of dicts
     
     Returns:
         str: Formatted transcript text
     """
-    formatted_lines = []
-    for msg in transcript:
-        if isinstance(msg, TranscriptMessage):
-            speaker = msg.speaker.upper()
-            message = msg.message
-        else:
-            speaker = msg.get("speaker", "unknown").upper()
-            message = msg.get("message", "")
-        
-        formatted_lines.append(f"{speaker}: {message}")
-    
-    return "\n".join(formatted_lines)
+    return "\n".join(_format_line(msg) for msg in transcript)
 
 
 async def evaluate_transcript(
@@ -138,8 +138,8 @@ Be objective and data-driven in your scoring."""
             temperature=temperature
         )
         
-        # Parse the JSON response
-        result_data = json.loads(result_json)
+        # Parse the JSON response (already-parsed dicts are used as-is)
+        result_data = result_json if isinstance(result_json, dict) else orjson.loads(result_json)
         
         # Extract scores
         scores_data = result_data.get("scores", {})
@@ -153,7 +153,7 @@ Be objective and data-driven in your scoring."""
         
         return scores, analysis
     
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"❌ Error parsing evaluation JSON: {str(e)}")
         raise Exception(f"Failed to parse evaluation response: {str(e)}")
     
@@ -5,7 +5,10 @@ Handles weighted score calculation and Writer-Critique cycle for prompt improvem
 """
 
 from typing import List, Dict, Tuple
+import functools
 import json
+import math
+import operator
 from google import genai
 from models.tuning_loop import ScenarioWeight
 from models.evaluation import EvaluationScores
@@ -22,7 +25,7 @@ async def calculate_weighted_average(
     Calculate the weighted average score from multiple evaluation results
     
     This function:
-    1. Fetches evaluation results from the database
+    1. Fetches evaluation results from the database in a single query
     2. Matches each evaluation with its scenario weight
     3. Calculates a weighted average of both task_completion and conversation_efficiency
     4. Returns a single weighted score (0-100)
@@ -59,13 +62,17 @@ async def calculate_weighted_average(
     # Create a map of scenario_id to weight for quick lookup
     weight_map = {sw.scenario_id: sw.weight for sw in scenario_weights}
     
-    total_weighted_score = 0.0
-    total_weight = 0
+    # Fetch all evaluations in one query instead of a round-trip per ID
+    object_ids = [ObjectId(eval_id) for eval_id in evaluation_ids]
+    cursor = collection.find({"_id": {"$in": object_ids}})
+    evaluations = {evaluation["_id"]: evaluation for evaluation in await cursor.to_list(length=None)}
     
-    # Fetch and process each evaluation
-    for eval_id in evaluation_ids:
-        # Fetch evaluation from database
-        evaluation = await collection.find_one({"_id": ObjectId(eval_id)})
+    evaluation_avgs = []
+    weights = []
+    
+    # Process each evaluation
+    for eval_id, object_id in zip(evaluation_ids, object_ids):
+        evaluation = evaluations.get(object_id)
         
         if not evaluation:
             raise ValueError(f"Evaluation not found: {eval_id}")
@@ -92,18 +99,21 @@ async def calculate_weighted_average(
         conversation_efficiency = scores.get("conversation_efficiency", 0)
         evaluation_avg = (task_completion + conversation_efficiency) / 2.0
         
-        # Add weighted score to total
-        total_weighted_score += evaluation_avg * weight
-        total_weight += weight
+        evaluation_avgs.append(evaluation_avg)
+        weights.append(weight)
     
     # Calculate final weighted average
+    total_weight = sum(weights)
     if total_weight == 0:
         return 0.0
     
+    # fsum over the products in one pass (math.sumprod needs Python 3.12)
+    total_weighted_score = math.fsum(map(operator.mul, evaluation_avgs, weights))
     weighted_average = total_weighted_score / total_weight
     return round(weighted_average, 2)
 
 
+@functools.lru_cache(maxsize=1)
 def create_writer_schema():
     """
     Create the JSON schema for Writer agent output (new prompt)
@@ -120,6 +130,7 @@ def create_writer_schema():
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_critique_schema():
     """
     Create the JSON schema for Critique agent output (feedback and pass/fail)
@@ -311,7 +322,26 @@ async def build_context_package(
     from core.database import get_scenarios_collection
     
     evaluations_collection = get_evaluations_collection()
-    scenarios_collection = get_scenarios_collection()
+    
+    # Fetch the failed evaluations with their scenarios joined on, in one round-trip
+    pipeline = [
+        {"$match": {"_id": {"$in": [ObjectId(eval_id) for eval_id in failed_evaluation_ids]}}},
+        {"$lookup": {
+            "from": get_scenarios_collection().name,
+            # scenario_id may be stored as a string, so convert it before joining;
+            # a malformed one joins nothing instead of failing the whole aggregation
+            "let": {"scenario_id": {"$convert": {
+                "input": "$scenario_id",
+                "to": "objectId",
+                "onError": None,
+                "onNull": None
+            }}},
+            "pipeline": [{"$match": {"$expr": {"$eq": ["$_id", "$$scenario_id"]}}}],
+            "as": "scenario"
+        }}
+    ]
+    cursor = evaluations_collection.aggregate(pipeline)
+    evaluations = {str(evaluation["_id"]): evaluation for evaluation in await cursor.to_list(length=None)}
     
     # Start building the context
     context = f"""CURRENT SYSTEM PROMPT:
@@ -325,13 +355,13 @@ TARGET SCORE: {target_score}
     context += "FAILED EVALUATIONS:\n\n"
     
     for i, eval_id in enumerate(failed_evaluation_ids, 1):
-        evaluation = await evaluations_collection.find_one({"_id": ObjectId(eval_id)})
+        evaluation = evaluations.get(str(ObjectId(eval_id)))
         
         if not evaluation:
             continue
         
         # Get scenario details
-        scenario = await scenarios_collection.find_one({"_id": ObjectId(evaluation.get("scenario_id"))})
+        scenario = next(iter(evaluation.get("scenario", [])), None)
         
         scores = evaluation.get("scores", {})
         task_completion = scores.get("task_completion", 0)
@@ -0,0 +1,42 @@
+"""
+Shared pytest fixtures for the backend test suite
+"""
+
+import httpx
+import pytest
+import pytest_asyncio
+
+BASE_URL = "http://localhost:8000"
+
+
+@pytest_asyncio.fixture(scope="session")
+async def api_client():
+    """One keep-alive HTTP client against the running backend for the whole session"""
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=60.0,  # AI scenario generation can be slow
+        limits=httpx.Limits(max_keepalive_connections=10)
+    ) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def app_client():
+    """One in-process client for the FastAPI app, shared by every API test in the session"""
+    # Imported here so suites that never touch the app don't need its dependencies
+    from main import app
+
+    # ASGITransport never sends lifespan events, so the app's startup hook
+    # (MongoDB connect) is skipped; tests patch the database calls they need
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def sync_app_client():
+    """Synchronous client for the FastAPI app, for tests that never await anything"""
+    from fastapi.testclient import TestClient
+    from main import app
+
+    # Not entered as a context manager, so the startup hook is skipped here too
+    return TestClient(app)
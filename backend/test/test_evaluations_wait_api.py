@@ -0,0 +1,142 @@
+"""
+API Tests for Phase 3, Module 3
+Tests POST /evaluations with and without ?wait=true against the in-process app
+"""
+
+import asyncio
+import pytest
+from fastapi import status
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch, DEFAULT
+from bson import ObjectId
+
+from api import evaluations as evaluations_module
+from models.evaluation import EvaluationResponse, EvaluationStatus
+
+# Status values as they appear in API payloads
+PENDING = EvaluationStatus.PENDING.value
+RUNNING = EvaluationStatus.RUNNING.value
+COMPLETED = EvaluationStatus.COMPLETED.value
+
+_PROMPT_ID = str(ObjectId())
+_SCENARIO_ID = str(ObjectId())
+_REQUEST = {"prompt_id": _PROMPT_ID, "scenario_id": _SCENARIO_ID}
+
+
+def _evaluation_document(result_id, evaluation_status):
+    """Evaluation document as returned by the database"""
+    document = {
+        "_id": result_id,
+        "prompt_id": _PROMPT_ID,
+        "scenario_id": _SCENARIO_ID,
+        "status": evaluation_status,
+        "created_at": "2025-10-04T10:30:00"
+    }
+    if evaluation_status == COMPLETED:
+        document.update({
+            "transcript": [
+                {"speaker": "agent", "message": "Hello, I'm calling regarding an outstanding balance."},
+                {"speaker": "debtor", "message": "I don't have the money right now."}
+            ],
+            "scores": {"task_completion": 75, "conversation_efficiency": 82},
+            "evaluator_analysis": "The agent was empathetic but could have offered more concrete solutions.",
+            "completed_at": "2025-10-04T10:32:15"
+        })
+    return document
+
+
+@pytest.fixture(autouse=True)
+def evaluation_db_mocks():
+    """Patch the evaluations router's database calls and evaluation runner for every test"""
+    result_id = str(ObjectId())
+    with patch.multiple(
+        evaluations_module.database,
+        new_callable=AsyncMock,
+        get_prompt_by_id=DEFAULT,
+        get_scenario_by_id=DEFAULT,
+        create_evaluation=DEFAULT,
+        get_evaluation_by_id=DEFAULT
+    ) as db_mocks, patch.object(evaluations_module, "perform_full_evaluation", new_callable=AsyncMock) as mock_run:
+        db_mocks["get_prompt_by_id"].return_value = {"_id": _PROMPT_ID, "name": "Test Prompt"}
+        db_mocks["get_scenario_by_id"].return_value = {"_id": _SCENARIO_ID, "title": "Test Scenario"}
+        db_mocks["create_evaluation"].return_value = result_id
+        yield SimpleNamespace(**db_mocks, perform_full_evaluation=mock_run, result_id=result_id)
+
+
+class TestCreateEvaluationEndpoint:
+    """Tests for POST /evaluations"""
+
+    @pytest.mark.asyncio
+    async def test_create_evaluation_without_wait(self, app_client, evaluation_db_mocks):
+        """Test the default request is queued as a background task and returns 202"""
+        response = await app_client.post("/evaluations", json=_REQUEST)
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.json() == {"result_id": evaluation_db_mocks.result_id, "status": PENDING}
+
+        # The background task runs once the response is sent; nothing is awaited inline
+        evaluation_db_mocks.perform_full_evaluation.assert_awaited_once_with(
+            result_id=evaluation_db_mocks.result_id,
+            prompt_id=_PROMPT_ID,
+            scenario_id=_SCENARIO_ID
+        )
+        evaluation_db_mocks.get_evaluation_by_id.assert_not_awaited()
+        assert not evaluations_module._inline_evaluations
+
+    @pytest.mark.asyncio
+    async def test_create_evaluation_wait_completes(self, app_client, evaluation_db_mocks):
+        """Test wait=true returns the finished evaluation with 200"""
+        evaluation_db_mocks.get_evaluation_by_id.return_value = _evaluation_document(
+            evaluation_db_mocks.result_id, COMPLETED
+        )
+
+        response = await app_client.post("/evaluations", params={"wait": "true"}, json=_REQUEST)
+
+        assert response.status_code == status.HTTP_200_OK
+        evaluation = EvaluationResponse(**response.json())
+        assert evaluation.id == evaluation_db_mocks.result_id
+        assert evaluation.status == EvaluationStatus.COMPLETED
+        assert evaluation.scores.task_completion == 75
+
+        evaluation_db_mocks.perform_full_evaluation.assert_awaited_once_with(
+            result_id=evaluation_db_mocks.result_id,
+            prompt_id=_PROMPT_ID,
+            scenario_id=_SCENARIO_ID
+        )
+        assert not evaluations_module._inline_evaluations
+
+    @pytest.mark.asyncio
+    async def test_create_evaluation_wait_times_out(self, app_client, evaluation_db_mocks):
+        """Test a timed-out wait returns 202 while the evaluation keeps running"""
+        release = asyncio.Event()
+        finished = asyncio.Event()
+
+        async def slow_evaluation(**kwargs):
+            await release.wait()
+            finished.set()
+
+        evaluation_db_mocks.perform_full_evaluation.side_effect = slow_evaluation
+        evaluation_db_mocks.get_evaluation_by_id.return_value = _evaluation_document(
+            evaluation_db_mocks.result_id, RUNNING
+        )
+
+        with patch.object(evaluations_module, "EVALUATION_WAIT_TIMEOUT", 0.05):
+            response = await app_client.post("/evaluations", params={"wait": "true"}, json=_REQUEST)
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.json() == {"result_id": evaluation_db_mocks.result_id, "status": RUNNING}
+
+        # The timeout didn't cancel the run; the module still holds it
+        assert len(evaluations_module._inline_evaluations) == 1
+        (evaluation_task,) = evaluations_module._inline_evaluations
+        assert not evaluation_task.done()
+
+        release.set()
+        await asyncio.wait_for(evaluation_task, timeout=1)
+
+        assert finished.is_set()
+        assert not evaluations_module._inline_evaluations
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
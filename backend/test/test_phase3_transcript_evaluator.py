@@ -7,8 +7,7 @@ No pytest dependency - uses simple Python assertions and asyncio
 import sys
 import os
 import asyncio
-import json
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import patch
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -20,6 +19,43 @@ from services.transcript_evaluator import (
 )
 from models.evaluation import TranscriptMessage, EvaluationScores
 
+# Shared read-only transcript, validated once at import instead of per test
+_SAMPLE_TRANSCRIPT = (
+    TranscriptMessage(speaker="agent", message="Hello, I'm calling about your debt."),
+    TranscriptMessage(speaker="debtor", message="I can't pay right now."),
+    TranscriptMessage(speaker="agent", message="Can we arrange a payment plan?")
+)
+
+# Per-test output is only printed when requested (TEST_VERBOSE=1 or --verbose)
+_VERBOSE = os.getenv("TEST_VERBOSE") == "1" or "--verbose" in sys.argv
+
+
+def _log(*args):
+    """Print per-test progress details in verbose mode only"""
+    if _VERBOSE:
+        print(*args)
+
+
+_BAR = "=" * 70
+
+
+def _banner(title):
+    """Write a section banner in a single call"""
+    sys.stdout.write(f"\n{_BAR}\n{title}\n{_BAR}\n")
+
+
+# Shared event loop for every async test when run as a script
+_LOOP = None
+
+
+def _run(coro):
+    """Run a coroutine on the shared event loop, creating it on first use"""
+    global _LOOP
+    if _LOOP is None:
+        _LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+    return _LOOP.run_until_complete(coro)
+
 
 # ============================================================================
 # TEST 1: Schema Creation Tests
@@ -27,14 +63,14 @@ from models.evaluation import TranscriptMessage, EvaluationScores
 
 def test_evaluation_schema_structure():
     """Test that the evaluation schema is created correctly"""
-    print("\n🧪 TEST 1.1: Evaluation schema structure")
+    _log("\n🧪 TEST 1.1: Evaluation schema structure")
     
     schema = create_evaluation_schema()
     
     # Verify schema exists and has expected structure
     assert schema is not None, "Schema should not be None"
-    print("   ✅ Schema created successfully")
-    print("   ✅ Schema contains required fields for structured output")
+    _log("   ✅ Schema created successfully")
+    _log("   ✅ Schema contains required fields for structured output")
 
 
 # ============================================================================
@@ -43,13 +79,9 @@ def test_evaluation_schema_structure():
 
 def test_format_transcript_with_objects():
     """Test formatting transcript with TranscriptMessage objects"""
-    print("\n🧪 TEST 2.1: Format transcript with TranscriptMessage objects")
+    _log("\n🧪 TEST 2.1: Format transcript with TranscriptMessage objects")
     
-    transcript = [
-        TranscriptMessage(speaker="agent", message="Hello, I'm calling about your debt."),
-        TranscriptMessage(speaker="debtor", message="I can't pay right now."),
-        TranscriptMessage(speaker="agent", message="Can we arrange a payment plan?")
-    ]
+    transcript = _SAMPLE_TRANSCRIPT
     
     formatted = format_transcript_for_evaluation(transcript)
     
@@ -59,12 +91,12 @@ def test_format_transcript_with_objects():
     assert "DEBTOR:" in lines[1]
     assert "AGENT:" in lines[2]
     
-    print("   ✅ TranscriptMessage objects formatted correctly")
+    _log("   ✅ TranscriptMessage objects formatted correctly")
 
 
 def test_format_transcript_with_dicts():
     """Test formatting transcript with dictionary objects"""
-    print("\n🧪 TEST 2.2: Format transcript with dictionary objects")
+    _log("\n🧪 TEST 2.2: Format transcript with dictionary objects")
     
     transcript = [
         {"speaker": "agent", "message": "Hello, I'm calling about your debt."},
@@ -79,154 +111,138 @@ def test_format_transcript_with_dicts():
     assert "AGENT:" in lines[0]
     assert "DEBTOR:" in lines[1]
     
-    print("   ✅ Dictionary objects formatted correctly")
+    _log("   ✅ Dictionary objects formatted correctly")
 
 
 def test_format_empty_transcript():
     """Test formatting empty transcript"""
-    print("\n🧪 TEST 2.3: Format empty transcript")
+    _log("\n🧪 TEST 2.3: Format empty transcript")
     
     formatted = format_transcript_for_evaluation([])
     assert formatted == "", "Empty transcript should return empty string"
     
-    print("   ✅ Empty transcript handled correctly")
+    _log("   ✅ Empty transcript handled correctly")
 
 
 # ============================================================================
 # TEST 3: Evaluate Transcript with Mocked Gemini API
 # ============================================================================
 
-async def test_evaluate_transcript_high_scores():
-    """Test evaluation with high-scoring conversation (MOCKED)"""
-    print("\n🧪 TEST 3.1: Evaluate high-scoring transcript (MOCKED)")
-    
-    transcript = [
-        {"speaker": "agent", "message": "Hello, I'm calling about an outstanding balance of $500."},
-        {"speaker": "debtor", "message": "Oh yes, I've been meaning to pay that."},
-        {"speaker": "agent", "message": "Great! Would you like to pay in full today or set up a payment plan?"},
-        {"speaker": "debtor", "message": "I can pay in full today."},
-        {"speaker": "agent", "message": "Excellent. I'll process that payment now."}
-    ]
-    
-    # Mock the Gemini API response
-    mock_response = {
-        "scores": {
-            "task_completion": 95,
-            "conversation_efficiency": 90
+# Score tiers: (label, transcript, mocked Gemini response, scenario objective,
+# expected task_completion, expected conversation_efficiency, analysis keywords).
+# An expected score is an exact value, or a (low, high) range for the medium tier.
+_SCORE_TIER_CASES = [
+    (
+        "high",
+        [
+            {"speaker": "agent", "message": "Hello, I'm calling about an outstanding balance of $500."},
+            {"speaker": "debtor", "message": "Oh yes, I've been meaning to pay that."},
+            {"speaker": "agent", "message": "Great! Would you like to pay in full today or set up a payment plan?"},
+            {"speaker": "debtor", "message": "I can pay in full today."},
+            {"speaker": "agent", "message": "Excellent. I'll process that payment now."}
+        ],
+        {
+            "scores": {
+                "task_completion": 95,
+                "conversation_efficiency": 90
+            },
+            "evaluator_analysis": "The agent successfully collected payment in a clear and efficient manner. The conversation was focused and the agent provided clear options."
         },
-        "evaluator_analysis": "The agent successfully collected payment in a clear and efficient manner. The conversation was focused and the agent provided clear options."
-    }
-    
-    with patch('services.transcript_evaluator.generate_structured_content') as mock_generate:
-        mock_generate.return_value = json.dumps(mock_response)
-        
-        scores, analysis = await evaluate_transcript(
-            transcript=transcript,
-            scenario_objective="Pay the debt today"
-        )
-        
-        # Verify scores
-        assert isinstance(scores, EvaluationScores), "Should return EvaluationScores object"
-        assert scores.task_completion == 95, f"Expected 95, got {scores.task_completion}"
-        assert scores.conversation_efficiency == 90, f"Expected 90, got {scores.conversation_efficiency}"
-        
-        # Verify analysis
-        assert isinstance(analysis, str), "Analysis should be a string"
-        assert len(analysis) > 0, "Analysis should not be empty"
-        assert "successfully" in analysis.lower() or "efficient" in analysis.lower()
-        
-        # Verify mock was called
-        assert mock_generate.call_count == 1, "Should call Gemini API once"
-        
-        print(f"   ✅ Task Completion: {scores.task_completion}/100")
-        print(f"   ✅ Conversation Efficiency: {scores.conversation_efficiency}/100")
-        print(f"   ✅ Analysis returned: {len(analysis)} characters")
+        "Pay the debt today",
+        95,
+        90,
+        ("successfully", "efficient")
+    ),
+    (
+        "low",
+        [
+            {"speaker": "agent", "message": "Pay your debt now!"},
+            {"speaker": "debtor", "message": "I can't!"},
+            {"speaker": "agent", "message": "You have to pay!"},
+            {"speaker": "debtor", "message": "Leave me alone!"},
+            {"speaker": "agent", "message": "I'm calling the police!"},
+            {"speaker": "debtor", "message": "I'm hanging up now."}
+        ],
+        {
+            "scores": {
+                "task_completion": 20,
+                "conversation_efficiency": 15
+            },
+            "evaluator_analysis": "The agent was aggressive and threatening, which is non-compliant. The conversation was inefficient with no concrete progress toward resolution."
+        },
+        "Avoid paying the debt",
+        20,
+        15,
+        ("aggressive", "poor", "non-compliant")
+    ),
+    (
+        "medium",
+        [
+            {"speaker": "agent", "message": "Hello, I'm calling about your account."},
+            {"speaker": "debtor", "message": "I'm not sure I can pay right now."},
+            {"speaker": "agent", "message": "I understand. What's your situation?"},
+            {"speaker": "debtor", "message": "I lost my job last month."},
+            {"speaker": "agent", "message": "That's difficult. Can you pay something small?"},
+            {"speaker": "debtor", "message": "Maybe $50 next week?"},
+            {"speaker": "agent", "message": "Let me check... okay, that works."}
+        ],
+        {
+            "scores": {
+                "task_completion": 60,
+                "conversation_efficiency": 65
+            },
+            "evaluator_analysis": "The agent showed empathy and made some progress, but could have been more proactive in offering structured payment plan options."
+        },
+        "Negotiate a payment plan",
+        (50, 70),
+        (50, 75),
+        ("empathy", "progress")
+    ),
+]
 
 
-async def test_evaluate_transcript_low_scores():
-    """Test evaluation with low-scoring conversation (MOCKED)"""
-    print("\n🧪 TEST 3.2: Evaluate low-scoring transcript (MOCKED)")
-    
-    transcript = [
-        {"speaker": "agent", "message": "Pay your debt now!"},
-        {"speaker": "debtor", "message": "I can't!"},
-        {"speaker": "agent", "message": "You have to pay!"},
-        {"speaker": "debtor", "message": "Leave me alone!"},
-        {"speaker": "agent", "message": "I'm calling the police!"},
-        {"speaker": "debtor", "message": "I'm hanging up now."}
-    ]
-    
-    # Mock the Gemini API response for poor performance
-    mock_response = {
-        "scores": {
-            "task_completion": 20,
-            "conversation_efficiency": 15
-        },
-        "evaluator_analysis": "The agent was aggressive and threatening, which is non-compliant. The conversation was inefficient with no concrete progress toward resolution."
-    }
-    
-    with patch('services.transcript_evaluator.generate_structured_content') as mock_generate:
-        mock_generate.return_value = json.dumps(mock_response)
-        
-        scores, analysis = await evaluate_transcript(
-            transcript=transcript,
-            scenario_objective="Avoid paying the debt"
-        )
-        
-        # Verify low scores
-        assert scores.task_completion == 20, f"Expected 20, got {scores.task_completion}"
-        assert scores.conversation_efficiency == 15, f"Expected 15, got {scores.conversation_efficiency}"
-        
-        # Verify critical analysis
-        assert "aggressive" in analysis.lower() or "poor" in analysis.lower() or "non-compliant" in analysis.lower()
-        
-        print(f"   ✅ Task Completion: {scores.task_completion}/100 (low score)")
-        print(f"   ✅ Conversation Efficiency: {scores.conversation_efficiency}/100 (low score)")
-        print(f"   ✅ Critical analysis provided")
+def _assert_score(label, name, actual, expected):
+    """Check a score against an exact value or a (low, high) range"""
+    if isinstance(expected, tuple):
+        low, high = expected
+        assert low <= actual <= high, f"[{label}] Expected {name} in {expected}, got {actual}"
+    else:
+        assert actual == expected, f"[{label}] Expected {name} {expected}, got {actual}"
 
 
-async def test_evaluate_transcript_medium_scores():
-    """Test evaluation with medium-scoring conversation (MOCKED)"""
-    print("\n🧪 TEST 3.3: Evaluate medium-scoring transcript (MOCKED)")
-    
-    transcript = [
-        {"speaker": "agent", "message": "Hello, I'm calling about your account."},
-        {"speaker": "debtor", "message": "I'm not sure I can pay right now."},
-        {"speaker": "agent", "message": "I understand. What's your situation?"},
-        {"speaker": "debtor", "message": "I lost my job last month."},
-        {"speaker": "agent", "message": "That's difficult. Can you pay something small?"},
-        {"speaker": "debtor", "message": "Maybe $50 next week?"},
-        {"speaker": "agent", "message": "Let me check... okay, that works."}
-    ]
-    
-    mock_response = {
-        "scores": {
-            "task_completion": 60,
-            "conversation_efficiency": 65
-        },
-        "evaluator_analysis": "The agent showed empathy and made some progress, but could have been more proactive in offering structured payment plan options."
-    }
+# Named check_* so pytest doesn't collect them: run_async_tests drives them
+async def check_evaluate_transcript_score_tiers():
+    """Test evaluation across high, low and medium scoring conversations (MOCKED)"""
+    _log("\n🧪 TEST 3.1: Evaluate high/low/medium-scoring transcripts (MOCKED)")
     
     with patch('services.transcript_evaluator.generate_structured_content') as mock_generate:
-        mock_generate.return_value = json.dumps(mock_response)
-        
-        scores, analysis = await evaluate_transcript(
-            transcript=transcript,
-            scenario_objective="Negotiate a payment plan"
-        )
-        
-        # Verify medium scores
-        assert 50 <= scores.task_completion <= 70, f"Expected medium score, got {scores.task_completion}"
-        assert 50 <= scores.conversation_efficiency <= 75, f"Expected medium score, got {scores.conversation_efficiency}"
-        
-        print(f"   ✅ Task Completion: {scores.task_completion}/100 (medium score)")
-        print(f"   ✅ Conversation Efficiency: {scores.conversation_efficiency}/100 (medium score)")
-        print(f"   ✅ Balanced analysis provided")
-
-
-async def test_evaluate_with_scenario_objective():
+        for label, transcript, mock_response, objective, expected_task, expected_efficiency, keywords in _SCORE_TIER_CASES:
+            mock_generate.reset_mock()
+            mock_generate.return_value = mock_response
+            
+            scores, analysis = await evaluate_transcript(
+                transcript=transcript,
+                scenario_objective=objective
+            )
+            
+            # Verify scores
+            assert isinstance(scores, EvaluationScores), "Should return EvaluationScores object"
+            _assert_score(label, "task_completion", scores.task_completion, expected_task)
+            _assert_score(label, "conversation_efficiency", scores.conversation_efficiency, expected_efficiency)
+            
+            # Verify analysis
+            assert isinstance(analysis, str) and analysis, f"[{label}] Analysis should be a non-empty string"
+            assert any(word in analysis.lower() for word in keywords), f"[{label}] Analysis should mention one of {keywords}"
+            
+            # Verify mock was called
+            assert mock_generate.call_count == 1, f"[{label}] Should call Gemini API once"
+            
+            _log(f"   ✅ {label}: Task Completion {scores.task_completion}/100, Conversation Efficiency {scores.conversation_efficiency}/100")
+
+
+async def check_evaluate_with_scenario_objective():
     """Test that scenario objective is included in evaluation prompt"""
-    print("\n🧪 TEST 3.4: Scenario objective integration (MOCKED)")
+    _log("\n🧪 TEST 3.2: Scenario objective integration (MOCKED)")
     
     transcript = [
         {"speaker": "agent", "message": "Let's discuss your debt."},
@@ -244,7 +260,7 @@ async def test_evaluate_with_scenario_objective():
     }
     
     with patch('services.transcript_evaluator.generate_structured_content') as mock_generate:
-        mock_generate.return_value = json.dumps(mock_response)
+        mock_generate.return_value = mock_response
         
         scores, analysis = await evaluate_transcript(
             transcript=transcript,
@@ -258,13 +274,13 @@ async def test_evaluate_with_scenario_objective():
         assert scenario_objective in prompt, "Scenario objective should be in the prompt"
         assert "DEBTOR'S OBJECTIVE:" in prompt, "Prompt should label the objective"
         
-        print("   ✅ Scenario objective included in evaluation prompt")
-        print("   ✅ Prompt properly formatted with objective")
+        _log("   ✅ Scenario objective included in evaluation prompt")
+        _log("   ✅ Prompt properly formatted with objective")
 
 
-async def test_evaluate_error_handling():
+async def check_evaluate_error_handling():
     """Test error handling when Gemini API fails"""
-    print("\n🧪 TEST 3.5: Error handling during evaluation (MOCKED)")
+    _log("\n🧪 TEST 3.3: Error handling during evaluation (MOCKED)")
     
     transcript = [
         {"speaker": "agent", "message": "Hello"},
@@ -284,12 +300,12 @@ async def test_evaluate_error_handling():
         except Exception as e:
             # Should re-raise the exception
             assert "Gemini API error" in str(e) or "error" in str(e).lower()
-            print("   ✅ Errors are properly raised")
+            _log("   ✅ Errors are properly raised")
 
 
-async def test_evaluate_with_custom_model():
+async def check_evaluate_with_custom_model():
     """Test evaluation with custom model name and temperature"""
-    print("\n🧪 TEST 3.6: Custom model and temperature (MOCKED)")
+    _log("\n🧪 TEST 3.4: Custom model and temperature (MOCKED)")
     
     transcript = [
         {"speaker": "agent", "message": "Test"},
@@ -305,7 +321,7 @@ async def test_evaluate_with_custom_model():
     }
     
     with patch('services.transcript_evaluator.generate_structured_content') as mock_generate:
-        mock_generate.return_value = json.dumps(mock_response)
+        mock_generate.return_value = mock_response
         
         scores, analysis = await evaluate_transcript(
             transcript=transcript,
@@ -319,8 +335,8 @@ async def test_evaluate_with_custom_model():
         assert call_kwargs['model_name'] == "custom-model", "Should use custom model"
         assert call_kwargs['temperature'] == 0.5, "Should use custom temperature"
         
-        print("   ✅ Custom model name passed correctly")
-        print("   ✅ Custom temperature passed correctly")
+        _log("   ✅ Custom model name passed correctly")
+        _log("   ✅ Custom temperature passed correctly")
 
 
 # ============================================================================
@@ -329,28 +345,21 @@ async def test_evaluate_with_custom_model():
 
 async def run_async_tests():
     """Run all async tests"""
-    print("\n" + "="*70)
-    print("ASYNC TESTS: Transcript Evaluation with Mocked Gemini")
-    print("="*70)
+    _banner("ASYNC TESTS: Transcript Evaluation with Mocked Gemini")
     
-    await test_evaluate_transcript_high_scores()
-    await test_evaluate_transcript_low_scores()
-    await test_evaluate_transcript_medium_scores()
-    await test_evaluate_with_scenario_objective()
-    await test_evaluate_error_handling()
-    await test_evaluate_with_custom_model()
+    # Run one at a time: each test patches the same module-level Gemini call
+    await check_evaluate_transcript_score_tiers()
+    await check_evaluate_with_scenario_objective()
+    await check_evaluate_error_handling()
+    await check_evaluate_with_custom_model()
 
 
 def run_all_tests():
     """Run all tests for transcript evaluator"""
-    print("\n" + "="*70)
-    print("PHASE 3.3 BACKEND TESTING: TRANSCRIPT EVALUATOR")
-    print("="*70)
+    _banner("PHASE 3.3 BACKEND TESTING: TRANSCRIPT EVALUATOR")
     
     # Run synchronous tests
-    print("\n" + "="*70)
-    print("UNIT TESTS: Schema and Formatting")
-    print("="*70)
+    _banner("UNIT TESTS: Schema and Formatting")
     
     test_evaluation_schema_structure()
     test_format_transcript_with_objects()
@@ -358,17 +367,15 @@ def run_all_tests():
     test_format_empty_transcript()
     
     # Run async tests
-    asyncio.run(run_async_tests())
+    _run(run_async_tests())
     
     # Summary
-    print("\n" + "="*70)
-    print("✅ ALL TRANSCRIPT EVALUATOR TESTS PASSED")
-    print("="*70)
+    _banner("✅ ALL TRANSCRIPT EVALUATOR TESTS PASSED")
     print("Summary:")
     print("  - Schema and formatting: ✅ 4/4 tests passed")
-    print("  - Evaluation logic: ✅ 6/6 tests passed")
-    print("  - Total: ✅ 10/10 tests passed")
-    print("="*70)
+    print("  - Evaluation logic: ✅ 4/4 tests passed")
+    print("  - Total: ✅ 8/8 tests passed")
+    print(_BAR)
 
 
 if __name__ == "__main__":
@@ -381,3 +388,6 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"\n❌ ERROR: {e}\n")
         sys.exit(1)
+    finally:
+        if _LOOP is not None:
+            _LOOP.close()
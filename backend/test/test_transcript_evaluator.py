@@ -1,6 +1,9 @@
 """
 Unit Tests for Transcript Evaluator Service
 Tests the AI-powered transcript evaluation logic with mocked Gemini API calls
+
+Each class is pinned to its own pytest-xdist group, so the suite can be spread
+across workers with: pytest -n auto --dist loadgroup
 """
 
 import sys
@@ -9,6 +12,8 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 import pytest
 import json
+import orjson
+from types import MappingProxyType
 from unittest.mock import AsyncMock, patch
 from services.transcript_evaluator import (
     evaluate_transcript,
@@ -18,7 +23,42 @@ from services.transcript_evaluator import (
 )
 from models.evaluation import TranscriptMessage, EvaluationScores
 
+# Canonical mocked Gemini responses, serialized once at import
+_MOCK_50_50 = json.dumps({
+    "scores": {"task_completion": 50, "conversation_efficiency": 50},
+    "evaluator_analysis": "Test"
+})
+_MOCK_80_85 = json.dumps({
+    "scores": {"task_completion": 80, "conversation_efficiency": 85},
+    "evaluator_analysis": "Good performance"
+})
+_MOCK_0_100 = json.dumps({
+    "scores": {"task_completion": 0, "conversation_efficiency": 100},
+    "evaluator_analysis": "Test analysis"
+})
+
+# Shared read-only transcript, validated once at import instead of per test
+_SAMPLE_TRANSCRIPT = (
+    TranscriptMessage(speaker="agent", message="Hello, I'm calling about your debt."),
+    TranscriptMessage(speaker="debtor", message="I can't pay right now."),
+    TranscriptMessage(speaker="agent", message="Let's discuss options.")
+)
+
+
+@pytest.fixture(scope="module")
+def single_agent_transcript():
+    """A one-message transcript shared by the module; read-only so tests can't mutate it"""
+    return (MappingProxyType({"speaker": "agent", "message": "Test"}),)
+
+
+@pytest.fixture
+def mock_generate():
+    """Patch the evaluator's Gemini call with an AsyncMock for one test"""
+    with patch('services.transcript_evaluator.generate_structured_content', new_callable=AsyncMock) as mock:
+        yield mock
 
+
+@pytest.mark.xdist_group("evaluator-schema")
 class TestSchemaCreation:
     """Test evaluation schema creation"""
     
@@ -39,50 +79,62 @@ class TestSchemaCreation:
         assert scores_schema.type.name == "OBJECT"
         assert "task_completion" in scores_schema.required
         assert "conversation_efficiency" in scores_schema.required
+    
+    def test_schema_is_cached(self):
+        """Test that the static schema is built once and reused"""
+        assert create_evaluation_schema() is create_evaluation_schema()
 
 
+@pytest.mark.xdist_group("evaluator-formatting")
 class TestTranscriptFormatting:
     """Test transcript formatting for evaluation"""
     
-    def test_format_transcript_with_objects(self):
-        """Test formatting TranscriptMessage objects"""
-        transcript = [
-            TranscriptMessage(speaker="agent", message="Hello, I'm calling about your debt."),
-            TranscriptMessage(speaker="debtor", message="I can't pay right now."),
-            TranscriptMessage(speaker="agent", message="Let's discuss options.")
-        ]
-        
-        formatted = format_transcript_for_evaluation(transcript)
-        
-        lines = formatted.split("\n")
-        assert len(lines) == 3
-        assert "AGENT: Hello, I'm calling about your debt." in formatted
-        assert "DEBTOR: I can't pay right now." in formatted
-        assert "AGENT: Let's discuss options." in formatted
-    
-    def test_format_transcript_with_dicts(self):
-        """Test formatting transcript as dictionaries"""
-        transcript = [
-            {"speaker": "agent", "message": "Hello"},
-            {"speaker": "debtor", "message": "Hi"}
-        ]
-        
+    @pytest.mark.parametrize("transcript,expected_lines", [
+        (
+            _SAMPLE_TRANSCRIPT,
+            [
+                "AGENT: Hello, I'm calling about your debt.",
+                "DEBTOR: I can't pay right now.",
+                "AGENT: Let's discuss options."
+            ]
+        ),
+        (
+            [
+                {"speaker": "agent", "message": "Hello"},
+                {"speaker": "debtor", "message": "Hi"}
+            ],
+            ["AGENT: Hello", "DEBTOR: Hi"]
+        ),
+        (
+            [
+                TranscriptMessage(speaker="agent", message="Hello"),
+                {"speaker": "debtor", "message": "Hi"}
+            ],
+            ["AGENT: Hello", "DEBTOR: Hi"]
+        ),
+        ([], []),
+    ], ids=["objects", "dicts", "mixed", "empty"])
+    def test_format_transcript(self, transcript, expected_lines):
+        """Test formatting TranscriptMessage objects, dicts, a mix and empty transcripts"""
         formatted = format_transcript_for_evaluation(transcript)
         
-        assert "AGENT: Hello" in formatted
-        assert "DEBTOR: Hi" in formatted
-    
-    def test_format_empty_transcript(self):
-        """Test formatting empty transcript"""
-        formatted = format_transcript_for_evaluation([])
-        assert formatted == ""
+        if not expected_lines:
+            assert formatted == ""
+        else:
+            assert formatted.split("\n") == expected_lines
 
 
+@pytest.mark.xdist_group("evaluator-mock")
 class TestEvaluateTranscript:
     """Test transcript evaluation with mocked Gemini API"""
     
     @pytest.mark.asyncio
-    async def test_evaluate_transcript_success(self):
+    @pytest.mark.parametrize(
+        "dumps",
+        [json.dumps, lambda obj: orjson.dumps(obj).decode()],
+        ids=["json", "orjson"]
+    )
+    async def test_evaluate_transcript_success(self, mock_generate, dumps):
         """Test successful transcript evaluation"""
         transcript = [
             {"speaker": "agent", "message": "Hello, calling about your debt."},
@@ -91,7 +143,7 @@ class TestEvaluateTranscript:
         ]
         
         # Mock Gemini API response
-        mock_response = json.dumps({
+        mock_response = dumps({
             "scores": {
                 "task_completion": 85,
                 "conversation_efficiency": 90
@@ -99,37 +151,36 @@ class TestEvaluateTranscript:
             "evaluator_analysis": "The agent handled the call efficiently and achieved payment commitment."
         })
         
-        with patch('services.transcript_evaluator.generate_structured_content') as mock_generate:
-            mock_generate.return_value = mock_response
-            
-            scores, analysis = await evaluate_transcript(
-                transcript=transcript,
-                scenario_objective="Avoid making payment"
-            )
-            
-            # Verify scores
-            assert isinstance(scores, EvaluationScores)
-            assert scores.task_completion == 85
-            assert scores.conversation_efficiency == 90
-            
-            # Verify analysis
-            assert "efficiently" in analysis.lower()
-            assert "payment" in analysis.lower()
-            
-            # Verify API was called
-            assert mock_generate.called
-            call_args = mock_generate.call_args
-            
-            # Check that transcript was included in prompt
-            prompt = call_args[1]['prompt']
-            assert "Hello, calling about your debt" in prompt
-            assert "I can pay $100 today" in prompt
-            
-            # Check that objective was included
-            assert "Avoid making payment" in prompt
+        mock_generate.return_value = mock_response
+        
+        scores, analysis = await evaluate_transcript(
+            transcript=transcript,
+            scenario_objective="Avoid making payment"
+        )
+        
+        # Verify scores
+        assert isinstance(scores, EvaluationScores)
+        assert scores.task_completion == 85
+        assert scores.conversation_efficiency == 90
+        
+        # Verify analysis
+        assert "efficiently" in analysis.lower()
+        assert "payment" in analysis.lower()
+        
+        # Verify API was called
+        assert mock_generate.called
+        call_args = mock_generate.call_args
+        
+        # Check that transcript was included in prompt
+        prompt = call_args[1]['prompt']
+        assert "Hello, calling about your debt" in prompt
+        assert "I can pay $100 today" in prompt
+        
+        # Check that objective was included
+        assert "Avoid making payment" in prompt
     
     @pytest.mark.asyncio
-    async def test_evaluate_transcript_with_objects(self):
+    async def test_evaluate_transcript_with_objects(self, mock_generate):
         """Test evaluation with TranscriptMessage objects"""
         transcript = [
             TranscriptMessage(speaker="agent", message="How can I help?"),
@@ -144,60 +195,43 @@ class TestEvaluateTranscript:
             "evaluator_analysis": "Agent was efficient but didn't secure commitment."
         })
         
-        with patch('services.transcript_evaluator.generate_structured_content') as mock_generate:
-            mock_generate.return_value = mock_response
-            
-            scores, analysis = await evaluate_transcript(
-                transcript=transcript,
-                scenario_objective="Get more time to pay"
-            )
-            
-            assert scores.task_completion == 50
-            assert scores.conversation_efficiency == 75
-            assert "efficient" in analysis.lower()
+        mock_generate.return_value = mock_response
+        
+        scores, analysis = await evaluate_transcript(
+            transcript=transcript,
+            scenario_objective="Get more time to pay"
+        )
+        
+        assert scores.task_completion == 50
+        assert scores.conversation_efficiency == 75
+        assert "efficient" in analysis.lower()
     
     @pytest.mark.asyncio
-    async def test_evaluate_transcript_score_ranges(self):
+    async def test_evaluate_transcript_score_ranges(self, single_agent_transcript, mock_generate):
         """Test that scores are validated to be in 0-100 range"""
-        transcript = [{"speaker": "agent", "message": "Test"}]
-        
         # Test with valid scores
-        mock_response = json.dumps({
-            "scores": {
-                "task_completion": 0,
-                "conversation_efficiency": 100
-            },
-            "evaluator_analysis": "Test analysis"
-        })
+        mock_generate.return_value = _MOCK_0_100
+        
+        scores, _ = await evaluate_transcript(single_agent_transcript, "Test objective")
         
-        with patch('services.transcript_evaluator.generate_structured_content') as mock_generate:
-            mock_generate.return_value = mock_response
-            
-            scores, _ = await evaluate_transcript(transcript, "Test objective")
-            
-            # Pydantic should validate these are in range
-            assert 0 <= scores.task_completion <= 100
-            assert 0 <= scores.conversation_efficiency <= 100
+        # Pydantic should validate these are in range
+        assert 0 <= scores.task_completion <= 100
+        assert 0 <= scores.conversation_efficiency <= 100
     
     @pytest.mark.asyncio
-    async def test_evaluate_transcript_json_error(self):
+    async def test_evaluate_transcript_json_error(self, single_agent_transcript, mock_generate):
         """Test handling of invalid JSON response"""
-        transcript = [{"speaker": "agent", "message": "Test"}]
-        
-        with patch('services.transcript_evaluator.generate_structured_content') as mock_generate:
-            # Return invalid JSON
-            mock_generate.return_value = "Not valid JSON"
-            
-            with pytest.raises(Exception) as exc_info:
-                await evaluate_transcript(transcript, "Test objective")
-            
-            assert "Failed to parse evaluation response" in str(exc_info.value)
+        # Return invalid JSON
+        mock_generate.return_value = "Not valid JSON"
+        
+        with pytest.raises(Exception) as exc_info:
+            await evaluate_transcript(single_agent_transcript, "Test objective")
+        
+        assert "Failed to parse evaluation response" in str(exc_info.value)
     
     @pytest.mark.asyncio
-    async def test_evaluate_transcript_missing_fields(self):
+    async def test_evaluate_transcript_missing_fields(self, single_agent_transcript, mock_generate):
         """Test handling of response with missing fields"""
-        transcript = [{"speaker": "agent", "message": "Test"}]
-        
         # Response missing required fields
         mock_response = json.dumps({
             "scores": {
@@ -207,118 +241,92 @@ class TestEvaluateTranscript:
             # Missing evaluator_analysis
         })
         
-        with patch('services.transcript_evaluator.generate_structured_content') as mock_generate:
-            mock_generate.return_value = mock_response
-            
-            # Should handle gracefully with defaults
-            scores, analysis = await evaluate_transcript(transcript, "Test")
-            
-            assert scores.task_completion == 75
-            assert scores.conversation_efficiency == 0  # Default
-            assert analysis == "No analysis provided."  # Default
+        mock_generate.return_value = mock_response
+        
+        # Should handle gracefully with defaults
+        scores, analysis = await evaluate_transcript(single_agent_transcript, "Test")
+        
+        assert scores.task_completion == 75
+        assert scores.conversation_efficiency == 0  # Default
+        assert analysis == "No analysis provided."  # Default
     
     @pytest.mark.asyncio
-    async def test_evaluate_transcript_api_error(self):
+    async def test_evaluate_transcript_api_error(self, single_agent_transcript, mock_generate):
         """Test handling of API errors"""
-        transcript = [{"speaker": "agent", "message": "Test"}]
-        
-        with patch('services.transcript_evaluator.generate_structured_content') as mock_generate:
-            mock_generate.side_effect = Exception("API error")
-            
-            with pytest.raises(Exception) as exc_info:
-                await evaluate_transcript(transcript, "Test objective")
-            
-            assert "Transcript evaluation failed" in str(exc_info.value)
+        mock_generate.side_effect = Exception("API error")
+        
+        with pytest.raises(Exception) as exc_info:
+            await evaluate_transcript(single_agent_transcript, "Test objective")
+        
+        assert "Transcript evaluation failed" in str(exc_info.value)
 
 
+@pytest.mark.xdist_group("evaluator-dict")
 class TestEvaluateTranscriptDict:
     """Test the dictionary wrapper function"""
     
     @pytest.mark.asyncio
-    async def test_evaluate_transcript_dict_format(self):
+    async def test_evaluate_transcript_dict_format(self, mock_generate):
         """Test that dict wrapper returns properly formatted dict"""
         transcript = [{"speaker": "agent", "message": "Hello"}]
         
-        mock_response = json.dumps({
-            "scores": {
-                "task_completion": 80,
-                "conversation_efficiency": 85
-            },
-            "evaluator_analysis": "Good performance"
-        })
+        mock_generate.return_value = _MOCK_80_85
+        
+        result = await evaluate_transcript_dict(
+            transcript_dicts=transcript,
+            scenario_objective="Test objective"
+        )
         
-        with patch('services.transcript_evaluator.generate_structured_content') as mock_generate:
-            mock_generate.return_value = mock_response
-            
-            result = await evaluate_transcript_dict(
-                transcript_dicts=transcript,
-                scenario_objective="Test objective"
-            )
-            
-            # Verify result is a dict with correct structure
-            assert isinstance(result, dict)
-            assert "scores" in result
-            assert "evaluator_analysis" in result
-            
-            # Verify scores structure
-            scores = result["scores"]
-            assert scores["task_completion"] == 80
-            assert scores["conversation_efficiency"] == 85
-            
-            # Verify analysis
-            assert result["evaluator_analysis"] == "Good performance"
+        # Verify result is a dict with correct structure
+        assert isinstance(result, dict)
+        assert "scores" in result
+        assert "evaluator_analysis" in result
+        
+        # Verify scores structure
+        scores = result["scores"]
+        assert scores["task_completion"] == 80
+        assert scores["conversation_efficiency"] == 85
+        
+        # Verify analysis
+        assert result["evaluator_analysis"] == "Good performance"
 
 
+@pytest.mark.xdist_group("evaluator-criteria")
 class TestEvaluationCriteria:
     """Test that evaluation considers the right criteria"""
     
     @pytest.mark.asyncio
-    async def test_evaluation_includes_criteria(self):
+    async def test_evaluation_includes_criteria(self, single_agent_transcript, mock_generate):
         """Test that evaluation prompt includes proper criteria"""
-        transcript = [{"speaker": "agent", "message": "Test"}]
+        mock_generate.return_value = _MOCK_50_50
         
-        mock_response = json.dumps({
-            "scores": {"task_completion": 50, "conversation_efficiency": 50},
-            "evaluator_analysis": "Test"
-        })
+        await evaluate_transcript(single_agent_transcript, "Test objective")
+        
+        # Get the prompt that was sent
+        call_args = mock_generate.call_args
+        prompt = call_args[1]['prompt']
         
-        with patch('services.transcript_evaluator.generate_structured_content') as mock_generate:
-            mock_generate.return_value = mock_response
-            
-            await evaluate_transcript(transcript, "Test objective")
-            
-            # Get the prompt that was sent
-            call_args = mock_generate.call_args
-            prompt = call_args[1]['prompt']
-            
-            # Verify criteria are mentioned
-            assert "task completion" in prompt.lower()
-            assert "conversation efficiency" in prompt.lower()
-            assert "relevant" in prompt.lower()
-            assert "repetition" in prompt.lower()
+        # Verify criteria are mentioned
+        assert "task completion" in prompt.lower()
+        assert "conversation efficiency" in prompt.lower()
+        assert "relevant" in prompt.lower()
+        assert "repetition" in prompt.lower()
     
     @pytest.mark.asyncio
-    async def test_evaluation_includes_goals(self):
+    async def test_evaluation_includes_goals(self, single_agent_transcript, mock_generate):
         """Test that evaluation includes both agent and debtor goals"""
-        transcript = [{"speaker": "agent", "message": "Test"}]
         objective = "Specific debtor objective here"
         
-        mock_response = json.dumps({
-            "scores": {"task_completion": 50, "conversation_efficiency": 50},
-            "evaluator_analysis": "Test"
-        })
+        mock_generate.return_value = _MOCK_50_50
+        
+        await evaluate_transcript(single_agent_transcript, objective)
+        
+        call_args = mock_generate.call_args
+        prompt = call_args[1]['prompt']
         
-        with patch('services.transcript_evaluator.generate_structured_content') as mock_generate:
-            mock_generate.return_value = mock_response
-            
-            await evaluate_transcript(transcript, objective)
-            
-            call_args = mock_generate.call_args
-            prompt = call_args[1]['prompt']
-            
-            # Verify both goals are in prompt
-            assert objective in prompt
-            assert "collect the debt" in prompt.lower() or "payment plan" in prompt.lower()
+        # Verify both goals are in prompt
+        assert objective in prompt
+        assert "collect the debt" in prompt.lower() or "payment plan" in prompt.lower()
 
 
 # Run tests
@@ -3,52 +3,72 @@ API Integration Tests for Phase 4, Sub-phase 4.3
 Tests the Tuning Loop endpoints (Automated Tuning Loop)
 """
 
+import asyncio
+import copy
+import json
 import pytest
-from httpx import AsyncClient, ASGITransport
 from fastapi import status
-from unittest.mock import AsyncMock, patch, MagicMock
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock, patch, DEFAULT
 from bson import ObjectId
 
-from main import app
+from api import tuning as tuning_module
 from models.tuning_loop import TuningStatus
 
+# Status values as they appear in API payloads
+PENDING = TuningStatus.PENDING.value
+RUNNING = TuningStatus.RUNNING.value
+COMPLETED = TuningStatus.COMPLETED.value
+FAILED = TuningStatus.FAILED.value
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 # Test data fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_prompt_id():
     """Valid prompt ID for testing"""
     return str(ObjectId())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_scenario_ids():
-    """Valid scenario IDs for testing"""
-    return [str(ObjectId()), str(ObjectId()), str(ObjectId())]
+    """Valid scenario IDs for testing (a tuple, since the session shares it)"""
+    return (str(ObjectId()), str(ObjectId()), str(ObjectId()))
 
 
-@pytest.fixture
-def tuning_loop_request(valid_prompt_id, valid_scenario_ids):
-    """Valid tuning loop creation request"""
+def _build_tuning_loop_request(prompt_id, scenario_ids):
+    """Build a valid tuning loop creation request body"""
     return {
-        "initial_prompt_id": valid_prompt_id,
+        "initial_prompt_id": prompt_id,
         "target_score": 85.0,
         "max_iterations": 3,
         "scenarios": [
-            {"scenario_id": valid_scenario_ids[0], "weight": 5},
-            {"scenario_id": valid_scenario_ids[1], "weight": 3},
-            {"scenario_id": valid_scenario_ids[2], "weight": 4}
+            {"scenario_id": scenario_ids[0], "weight": 5},
+            {"scenario_id": scenario_ids[1], "weight": 3},
+            {"scenario_id": scenario_ids[2], "weight": 4}
         ]
     }
 
 
-@pytest.fixture
-def mock_tuning_loop_document(valid_prompt_id, valid_scenario_ids):
-    """Mock tuning loop document from database"""
-    tuning_loop_id = str(ObjectId())
-    return {
-        "_id": tuning_loop_id,
+# Valid request the validation cases are derived from when the module is collected;
+# it never reaches the database, so its IDs needn't match the fixtures
+_VALID_REQUEST = _build_tuning_loop_request(str(ObjectId()), [str(ObjectId()) for _ in range(3)])
+
+
+@pytest.fixture(scope="session")
+def tuning_loop_request_bytes(valid_prompt_id, valid_scenario_ids):
+    """The valid creation request, serialized once for tests that send it unchanged"""
+    return json.dumps(_build_tuning_loop_request(valid_prompt_id, valid_scenario_ids)).encode()
+
+
+@pytest.fixture(scope="session")
+def _tuning_loop_prototype(valid_prompt_id, valid_scenario_ids):
+    """Read-only tuning loop document, built once per session"""
+    return MappingProxyType({
+        "_id": str(ObjectId()),
         "initial_prompt_id": valid_prompt_id,
-        "status": TuningStatus.PENDING.value,
+        "status": PENDING,
         "config": {
             "target_score": 85.0,
             "max_iterations": 3,
@@ -62,7 +82,28 @@ def mock_tuning_loop_document(valid_prompt_id, valid_scenario_ids):
         "final_prompt_id": None,
         "created_at": "2025-10-04T10:00:00",
         "updated_at": "2025-10-04T10:00:00"
-    }
+    })
+
+
+@pytest.fixture
+def mock_tuning_loop_document(_tuning_loop_prototype):
+    """Mock tuning loop document from database (a private copy tests may modify)"""
+    return copy.deepcopy(dict(_tuning_loop_prototype))
+
+
+@pytest.fixture(autouse=True)
+def tuning_db_mocks():
+    """Patch the tuning router's database calls and background task for every test"""
+    with patch.multiple(
+        tuning_module.database,
+        new_callable=AsyncMock,
+        get_prompt_by_id=DEFAULT,
+        get_scenario_by_id=DEFAULT,
+        insert_tuning_loop=DEFAULT,
+        get_tuning_loop_by_id=DEFAULT,
+        get_all_tuning_loops=DEFAULT
+    ) as db_mocks, patch.object(tuning_module, "perform_tuning_loop", new_callable=AsyncMock) as mock_bg_task:
+        yield SimpleNamespace(**db_mocks, perform_tuning_loop=mock_bg_task)
 
 
 class TestPostTuningEndpoint:
@@ -71,187 +112,109 @@ class TestPostTuningEndpoint:
     @pytest.mark.asyncio
     async def test_create_tuning_loop_success(
         self, 
-        tuning_loop_request,
+        app_client,
+        tuning_db_mocks,
+        tuning_loop_request_bytes,
         valid_prompt_id,
         valid_scenario_ids
     ):
         """Test successful tuning loop creation"""
         
-        # Mock database functions AND background task
-        with patch("api.tuning.database.get_prompt_by_id") as mock_get_prompt, \
-             patch("api.tuning.database.get_scenario_by_id") as mock_get_scenario, \
-             patch("api.tuning.database.insert_tuning_loop") as mock_insert, \
-             patch("api.tuning.perform_tuning_loop") as mock_bg_task:
-            
-            # Setup mocks
-            mock_get_prompt.return_value = {
-                "_id": valid_prompt_id,
-                "name": "Test Prompt v1.0",
-                "prompt_text": "Test prompt"
-            }
-            
-            mock_get_scenario.return_value = {
-                "_id": valid_scenario_ids[0],
-                "title": "Test Scenario"
-            }
-            
-            tuning_loop_id = str(ObjectId())
-            mock_insert.return_value = tuning_loop_id
-            
-            # Mock background task to do nothing
-            mock_bg_task.return_value = None
-            
-            # Make request
-            async with AsyncClient(
-                transport=ASGITransport(app=app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post("/tuning", json=tuning_loop_request)
-            
-            # Assert response
-            assert response.status_code == status.HTTP_202_ACCEPTED
-            data = response.json()
-            assert data["tuning_loop_id"] == tuning_loop_id
-            assert data["status"] == TuningStatus.PENDING.value
-            assert data["current_iteration"] is None
-            assert data["latest_score"] is None
-            
-            # Verify database calls
-            mock_get_prompt.assert_awaited_once_with(valid_prompt_id)
-            assert mock_get_scenario.await_count == 3  # Called for each scenario
-            mock_insert.assert_awaited_once()
+        # Setup mocks
+        tuning_db_mocks.get_prompt_by_id.return_value = {
+            "_id": valid_prompt_id,
+            "name": "Test Prompt v1.0",
+            "prompt_text": "Test prompt"
+        }
+        
+        tuning_db_mocks.get_scenario_by_id.return_value = {
+            "_id": valid_scenario_ids[0],
+            "title": "Test Scenario"
+        }
+        
+        tuning_loop_id = str(ObjectId())
+        tuning_db_mocks.insert_tuning_loop.return_value = tuning_loop_id
+        
+        # Make request
+        response = await app_client.post("/tuning", content=tuning_loop_request_bytes, headers=_JSON_HEADERS)
+        
+        # Assert response
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        data = response.json()
+        assert data["tuning_loop_id"] == tuning_loop_id
+        assert data["status"] == PENDING
+        assert data["current_iteration"] is None
+        assert data["latest_score"] is None
+        
+        # Verify database calls
+        tuning_db_mocks.get_prompt_by_id.assert_awaited_once_with(valid_prompt_id)
+        assert tuning_db_mocks.get_scenario_by_id.await_count == 3  # Called for each scenario
+        tuning_db_mocks.insert_tuning_loop.assert_awaited_once()
     
     @pytest.mark.asyncio
     async def test_create_tuning_loop_prompt_not_found(
         self,
-        tuning_loop_request,
+        app_client,
+        tuning_db_mocks,
+        tuning_loop_request_bytes,
         valid_prompt_id
     ):
         """Test tuning loop creation with non-existent prompt"""
         
-        with patch("api.tuning.database.get_prompt_by_id") as mock_get_prompt:
-            # Prompt does not exist
-            mock_get_prompt.return_value = None
-            
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.post("/tuning", json=tuning_loop_request)
-            
-            # Assert 404 error
-            assert response.status_code == status.HTTP_404_NOT_FOUND
-            data = response.json()
-            assert "not found" in data["detail"].lower()
-            assert valid_prompt_id in data["detail"]
+        # Prompt does not exist
+        tuning_db_mocks.get_prompt_by_id.return_value = None
+        
+        response = await app_client.post("/tuning", content=tuning_loop_request_bytes, headers=_JSON_HEADERS)
+        
+        # Assert 404 error
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        data = response.json()
+        assert "not found" in data["detail"].lower()
+        assert valid_prompt_id in data["detail"]
     
     @pytest.mark.asyncio
     async def test_create_tuning_loop_scenario_not_found(
         self,
-        tuning_loop_request,
+        app_client,
+        tuning_db_mocks,
+        tuning_loop_request_bytes,
         valid_prompt_id,
         valid_scenario_ids
     ):
         """Test tuning loop creation with non-existent scenario"""
         
-        with patch("api.tuning.database.get_prompt_by_id") as mock_get_prompt, \
-             patch("api.tuning.database.get_scenario_by_id") as mock_get_scenario:
-            
-            # Prompt exists
-            mock_get_prompt.return_value = {
-                "_id": valid_prompt_id,
-                "name": "Test Prompt"
-            }
-            
-            # First scenario does not exist
-            mock_get_scenario.return_value = None
-            
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.post("/tuning", json=tuning_loop_request)
-            
-            # Assert 404 error
-            assert response.status_code == status.HTTP_404_NOT_FOUND
-            data = response.json()
-            assert "scenario" in data["detail"].lower()
-            assert "not found" in data["detail"].lower()
-    
-    @pytest.mark.asyncio
-    async def test_create_tuning_loop_invalid_target_score(
-        self,
-        tuning_loop_request
-    ):
-        """Test validation for target_score out of range"""
-        
-        # Target score too high
-        invalid_request = tuning_loop_request.copy()
-        invalid_request["target_score"] = 150.0
-        
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-            response = await client.post("/tuning", json=invalid_request)
-        
-        # Assert validation error
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-    
-    @pytest.mark.asyncio
-    async def test_create_tuning_loop_invalid_max_iterations(
-        self,
-        tuning_loop_request
-    ):
-        """Test validation for max_iterations out of range"""
-        
-        # Max iterations too high
-        invalid_request = tuning_loop_request.copy()
-        invalid_request["max_iterations"] = 15
-        
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-            response = await client.post("/tuning", json=invalid_request)
-        
-        # Assert validation error
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-    
-    @pytest.mark.asyncio
-    async def test_create_tuning_loop_invalid_weight(
-        self,
-        tuning_loop_request
-    ):
-        """Test validation for scenario weight out of range"""
-        
-        # Weight too high
-        invalid_request = tuning_loop_request.copy()
-        invalid_request["scenarios"][0]["weight"] = 10
-        
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-            response = await client.post("/tuning", json=invalid_request)
-        
-        # Assert validation error
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-    
-    @pytest.mark.asyncio
-    async def test_create_tuning_loop_missing_required_fields(self):
-        """Test validation for missing required fields"""
-        
-        # Missing initial_prompt_id
-        invalid_request = {
-            "target_score": 85.0,
-            "max_iterations": 3,
-            "scenarios": []
+        # Prompt exists
+        tuning_db_mocks.get_prompt_by_id.return_value = {
+            "_id": valid_prompt_id,
+            "name": "Test Prompt"
         }
         
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-            response = await client.post("/tuning", json=invalid_request)
+        # First scenario does not exist
+        tuning_db_mocks.get_scenario_by_id.return_value = None
         
-        # Assert validation error
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-    
-    @pytest.mark.asyncio
-    async def test_create_tuning_loop_empty_scenarios(
-        self,
-        tuning_loop_request
-    ):
-        """Test validation for empty scenarios list"""
+        response = await app_client.post("/tuning", content=tuning_loop_request_bytes, headers=_JSON_HEADERS)
         
-        invalid_request = tuning_loop_request.copy()
-        invalid_request["scenarios"] = []
+        # Assert 404 error
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        data = response.json()
+        assert "scenario" in data["detail"].lower()
+        assert "not found" in data["detail"].lower()
+    
+    @pytest.mark.parametrize("payload", [
+        {**_VALID_REQUEST, "target_score": 150.0},      # target score too high
+        {**_VALID_REQUEST, "max_iterations": 15},       # max iterations too high
+        {                                               # weight too high
+            **_VALID_REQUEST,
+            "scenarios": [{**_VALID_REQUEST["scenarios"][0], "weight": 10}, *_VALID_REQUEST["scenarios"][1:]]
+        },
+        {k: v for k, v in _VALID_REQUEST.items() if k != "initial_prompt_id"},  # missing required field
+        {**_VALID_REQUEST, "scenarios": []},            # empty scenarios list
+    ], ids=["target_score", "max_iterations", "weight", "missing_prompt_id", "empty_scenarios"])
+    def test_create_tuning_loop_validation_errors(self, sync_app_client, payload):
+        """Test request validation rejects out-of-range and missing fields"""
         
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-            response = await client.post("/tuning", json=invalid_request)
+        # Rejected before any database call, so no event loop is needed
+        response = sync_app_client.post("/tuning", json=payload)
         
         # Assert validation error
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -261,211 +224,160 @@ class TestGetTuningLoopEndpoint:
     """Tests for GET /api/tuning/{tuning_loop_id} endpoint"""
     
     @pytest.mark.asyncio
-    async def test_get_tuning_loop_pending_status(
-        self,
-        mock_tuning_loop_document
-    ):
-        """Test retrieving a PENDING tuning loop"""
-        
-        tuning_loop_id = mock_tuning_loop_document["_id"]
-        
-        with patch("api.tuning.database.get_tuning_loop_by_id") as mock_get:
-            mock_get.return_value = mock_tuning_loop_document
-            
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.get(f"/tuning/{tuning_loop_id}")
-            
-            # Assert response
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert data["_id"] == tuning_loop_id
-            assert data["status"] == TuningStatus.PENDING.value
-            assert data["config"]["target_score"] == 85.0
-            assert data["config"]["max_iterations"] == 3
-            assert len(data["iterations"]) == 0
-            assert data["final_prompt_id"] is None
-            
-            mock_get.assert_awaited_once_with(tuning_loop_id)
-    
-    @pytest.mark.asyncio
-    async def test_get_tuning_loop_running_status(
-        self,
-        mock_tuning_loop_document,
-        valid_prompt_id
-    ):
-        """Test retrieving a RUNNING tuning loop with iterations"""
-        
-        tuning_loop_id = mock_tuning_loop_document["_id"]
-        
-        # Modify mock to show RUNNING status with iterations
-        mock_tuning_loop_document["status"] = TuningStatus.RUNNING.value
-        mock_tuning_loop_document["iterations"] = [
-            {
-                "iteration_number": 1,
-                "prompt_id": valid_prompt_id,
-                "evaluation_ids": [str(ObjectId()), str(ObjectId())],
-                "weighted_score": 75.5,
-                "started_at": "2025-10-04T10:01:00",
-                "completed_at": "2025-10-04T10:05:00"
-            }
-        ]
-        
-        with patch("api.tuning.database.get_tuning_loop_by_id") as mock_get:
-            mock_get.return_value = mock_tuning_loop_document
-            
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.get(f"/tuning/{tuning_loop_id}")
-            
-            # Assert response
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert data["status"] == TuningStatus.RUNNING.value
-            assert len(data["iterations"]) == 1
-            assert data["iterations"][0]["iteration_number"] == 1
-            assert data["iterations"][0]["weighted_score"] == 75.5
-    
-    @pytest.mark.asyncio
-    async def test_get_tuning_loop_completed_status(
+    async def test_get_tuning_loop_by_status(
         self,
+        app_client,
+        tuning_db_mocks,
         mock_tuning_loop_document,
         valid_prompt_id
     ):
-        """Test retrieving a COMPLETED tuning loop"""
+        """Test retrieving PENDING, RUNNING and COMPLETED tuning loops"""
         
-        tuning_loop_id = mock_tuning_loop_document["_id"]
         final_prompt_id = str(ObjectId())
         
-        # Modify mock to show COMPLETED status
-        mock_tuning_loop_document["status"] = TuningStatus.COMPLETED.value
-        mock_tuning_loop_document["final_prompt_id"] = final_prompt_id
-        mock_tuning_loop_document["iterations"] = [
-            {
-                "iteration_number": 1,
-                "prompt_id": valid_prompt_id,
-                "evaluation_ids": [str(ObjectId())],
-                "weighted_score": 75.5,
-                "started_at": "2025-10-04T10:01:00",
-                "completed_at": "2025-10-04T10:05:00"
-            },
-            {
-                "iteration_number": 2,
-                "prompt_id": final_prompt_id,
-                "evaluation_ids": [str(ObjectId())],
-                "weighted_score": 87.3,
-                "started_at": "2025-10-04T10:06:00",
-                "completed_at": "2025-10-04T10:10:00"
-            }
-        ]
-        
-        with patch("api.tuning.database.get_tuning_loop_by_id") as mock_get:
-            mock_get.return_value = mock_tuning_loop_document
-            
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.get(f"/tuning/{tuning_loop_id}")
-            
-            # Assert response
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert data["status"] == TuningStatus.COMPLETED.value
-            assert data["final_prompt_id"] == final_prompt_id
-            assert len(data["iterations"]) == 2
-            assert data["iterations"][1]["weighted_score"] > data["iterations"][0]["weighted_score"]
+        # The fixture document is PENDING; derive a RUNNING and a COMPLETED one from it
+        pending = mock_tuning_loop_document
+        running = {
+            **copy.deepcopy(pending),
+            "_id": str(ObjectId()),
+            "status": RUNNING,
+            "iterations": [
+                {
+                    "iteration_number": 1,
+                    "prompt_id": valid_prompt_id,
+                    "evaluation_ids": [str(ObjectId()), str(ObjectId())],
+                    "weighted_score": 75.5,
+                    "started_at": "2025-10-04T10:01:00",
+                    "completed_at": "2025-10-04T10:05:00"
+                }
+            ]
+        }
+        completed = {
+            **copy.deepcopy(pending),
+            "_id": str(ObjectId()),
+            "status": COMPLETED,
+            "final_prompt_id": final_prompt_id,
+            "iterations": [
+                {
+                    "iteration_number": 1,
+                    "prompt_id": valid_prompt_id,
+                    "evaluation_ids": [str(ObjectId())],
+                    "weighted_score": 75.5,
+                    "started_at": "2025-10-04T10:01:00",
+                    "completed_at": "2025-10-04T10:05:00"
+                },
+                {
+                    "iteration_number": 2,
+                    "prompt_id": final_prompt_id,
+                    "evaluation_ids": [str(ObjectId())],
+                    "weighted_score": 87.3,
+                    "started_at": "2025-10-04T10:06:00",
+                    "completed_at": "2025-10-04T10:10:00"
+                }
+            ]
+        }
+        documents = {doc["_id"]: doc for doc in (pending, running, completed)}
+        
+        # Requests overlap, so look documents up by ID rather than by call order
+        tuning_db_mocks.get_tuning_loop_by_id.side_effect = documents.get
+        
+        pending_response, running_response, completed_response = await asyncio.gather(
+            *(app_client.get(f"/tuning/{loop_id}") for loop_id in documents)
+        )
+        
+        # PENDING: no iterations yet
+        assert pending_response.status_code == status.HTTP_200_OK
+        data = pending_response.json()
+        assert data["_id"] == pending["_id"]
+        assert data["status"] == PENDING
+        assert data["config"]["target_score"] == 85.0
+        assert data["config"]["max_iterations"] == 3
+        assert len(data["iterations"]) == 0
+        assert data["final_prompt_id"] is None
+        
+        # RUNNING: one finished iteration
+        assert running_response.status_code == status.HTTP_200_OK
+        data = running_response.json()
+        assert data["status"] == RUNNING
+        assert len(data["iterations"]) == 1
+        assert data["iterations"][0]["iteration_number"] == 1
+        assert data["iterations"][0]["weighted_score"] == 75.5
+        
+        # COMPLETED: improved score and a final prompt
+        assert completed_response.status_code == status.HTTP_200_OK
+        data = completed_response.json()
+        assert data["status"] == COMPLETED
+        assert data["final_prompt_id"] == final_prompt_id
+        assert len(data["iterations"]) == 2
+        assert data["iterations"][1]["weighted_score"] > data["iterations"][0]["weighted_score"]
+        
+        assert tuning_db_mocks.get_tuning_loop_by_id.await_count == 3
+        for loop_id in documents:
+            tuning_db_mocks.get_tuning_loop_by_id.assert_any_await(loop_id)
     
     @pytest.mark.asyncio
-    async def test_get_tuning_loop_not_found(self):
+    async def test_get_tuning_loop_not_found(self, app_client, tuning_db_mocks):
         """Test retrieving non-existent tuning loop"""
         
         fake_id = str(ObjectId())
         
-        with patch("api.tuning.database.get_tuning_loop_by_id") as mock_get:
-            mock_get.return_value = None
-            
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.get(f"/tuning/{fake_id}")
-            
-            # Assert 404 error
-            assert response.status_code == status.HTTP_404_NOT_FOUND
-            data = response.json()
-            assert "not found" in data["detail"].lower()
-            assert fake_id in data["detail"]
+        tuning_db_mocks.get_tuning_loop_by_id.return_value = None
+        
+        response = await app_client.get(f"/tuning/{fake_id}")
+        
+        # Assert 404 error
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        data = response.json()
+        assert "not found" in data["detail"].lower()
+        assert fake_id in data["detail"]
     
     @pytest.mark.asyncio
-    async def test_get_tuning_loop_invalid_id_format(self):
+    async def test_get_tuning_loop_invalid_id_format(self, app_client, tuning_db_mocks):
         """Test retrieving with invalid ObjectId format"""
         
         invalid_id = "not-a-valid-objectid"
         
-        with patch("api.tuning.database.get_tuning_loop_by_id") as mock_get:
-            # Simulate the error that would occur with invalid ObjectId
-            mock_get.side_effect = Exception("Invalid ObjectId")
-            
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.get(f"/tuning/{invalid_id}")
-            
-            # Assert 500 error (handled by exception handler)
-            assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        # Simulate the error that would occur with invalid ObjectId
+        tuning_db_mocks.get_tuning_loop_by_id.side_effect = Exception("Invalid ObjectId")
+        
+        response = await app_client.get(f"/tuning/{invalid_id}")
+        
+        # Assert 500 error (handled by exception handler)
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
 
 
 class TestGetAllTuningLoopsEndpoint:
     """Tests for GET /api/tuning endpoint"""
     
     @pytest.mark.asyncio
-    async def test_get_all_tuning_loops_success(
+    @pytest.mark.parametrize("loop_statuses", [
+        (PENDING, COMPLETED, FAILED),
+        (),
+    ], ids=["mixed_statuses", "empty"])
+    async def test_get_all_tuning_loops(
         self,
-        mock_tuning_loop_document
+        app_client,
+        tuning_db_mocks,
+        mock_tuning_loop_document,
+        loop_statuses
     ):
-        """Test retrieving all tuning loops"""
-        
-        # Create multiple mock documents
-        mock_loops = [
-            mock_tuning_loop_document,
-            {
-                **mock_tuning_loop_document,
-                "_id": str(ObjectId()),
-                "status": TuningStatus.COMPLETED.value
-            },
-            {
-                **mock_tuning_loop_document,
-                "_id": str(ObjectId()),
-                "status": TuningStatus.FAILED.value
-            }
+        """Test retrieving all tuning loops, including when none exist"""
+        
+        # One mock document per requested status
+        tuning_db_mocks.get_all_tuning_loops.return_value = [
+            {**mock_tuning_loop_document, "_id": str(ObjectId()), "status": loop_status}
+            for loop_status in loop_statuses
         ]
         
-        with patch("api.tuning.database.get_all_tuning_loops") as mock_get_all:
-            mock_get_all.return_value = mock_loops
-            
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.get("/tuning")
-            
-            # Assert response
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert isinstance(data, list)
-            assert len(data) == 3
-            
-            # Check statuses
-            statuses = [loop["status"] for loop in data]
-            assert TuningStatus.PENDING.value in statuses
-            assert TuningStatus.COMPLETED.value in statuses
-            assert TuningStatus.FAILED.value in statuses
-            
-            mock_get_all.assert_awaited_once()
-    
-    @pytest.mark.asyncio
-    async def test_get_all_tuning_loops_empty(self):
-        """Test retrieving all tuning loops when none exist"""
-        
-        with patch("api.tuning.database.get_all_tuning_loops") as mock_get_all:
-            mock_get_all.return_value = []
-            
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                response = await client.get("/tuning")
-            
-            # Assert response
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert isinstance(data, list)
-            assert len(data) == 0
+        response = await app_client.get("/tuning")
+        
+        # Assert response
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert isinstance(data, list)
+        assert sorted(loop["status"] for loop in data) == sorted(loop_statuses)
+        
+        tuning_db_mocks.get_all_tuning_loops.assert_awaited_once()
 
 
 class TestTuningLoopIntegration:
@@ -474,7 +386,9 @@ class TestTuningLoopIntegration:
     @pytest.mark.asyncio
     async def test_full_workflow_create_and_poll(
         self,
-        tuning_loop_request,
+        app_client,
+        tuning_db_mocks,
+        tuning_loop_request_bytes,
         valid_prompt_id,
         valid_scenario_ids
     ):
@@ -482,49 +396,39 @@ class TestTuningLoopIntegration:
         
         tuning_loop_id = str(ObjectId())
         
-        with patch("api.tuning.database.get_prompt_by_id") as mock_get_prompt, \
-             patch("api.tuning.database.get_scenario_by_id") as mock_get_scenario, \
-             patch("api.tuning.database.insert_tuning_loop") as mock_insert, \
-             patch("api.tuning.database.get_tuning_loop_by_id") as mock_get_loop, \
-             patch("api.tuning.perform_tuning_loop") as mock_bg_task:
-            
-            # Setup mocks for creation
-            mock_get_prompt.return_value = {"_id": valid_prompt_id, "name": "Test"}
-            mock_get_scenario.return_value = {"_id": valid_scenario_ids[0], "title": "Test"}
-            mock_insert.return_value = tuning_loop_id
-            
-            # Mock background task to do nothing
-            mock_bg_task.return_value = None
-            
-            # Create tuning loop
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                create_response = await client.post("/tuning", json=tuning_loop_request)
-            
-            assert create_response.status_code == status.HTTP_202_ACCEPTED
-            response_data = create_response.json()
-            returned_id = response_data["tuning_loop_id"]
-            
-            # Setup mock for polling
-            mock_get_loop.return_value = {
-                "_id": returned_id,
-                "initial_prompt_id": valid_prompt_id,
-                "status": TuningStatus.RUNNING.value,
-                "config": {
-                    "target_score": 85.0,
-                    "max_iterations": 3,
-                    "scenario_weights": []
-                },
-                "iterations": [],
-                "final_prompt_id": None,
-                "created_at": "2025-10-04T10:00:00",
-                "updated_at": "2025-10-04T10:01:00"
-            }
-            
-            # Poll for status
-            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-                poll_response = await client.get(f"/tuning/{returned_id}")
-            
-            assert poll_response.status_code == status.HTTP_200_OK
-            poll_data = poll_response.json()
-            assert poll_data["_id"] == returned_id
-            assert poll_data["status"] == TuningStatus.RUNNING.value
+        # Setup mocks for creation
+        tuning_db_mocks.get_prompt_by_id.return_value = {"_id": valid_prompt_id, "name": "Test"}
+        tuning_db_mocks.get_scenario_by_id.return_value = {"_id": valid_scenario_ids[0], "title": "Test"}
+        tuning_db_mocks.insert_tuning_loop.return_value = tuning_loop_id
+        
+        # Create tuning loop
+        create_response = await app_client.post("/tuning", content=tuning_loop_request_bytes, headers=_JSON_HEADERS)
+        
+        assert create_response.status_code == status.HTTP_202_ACCEPTED
+        response_data = create_response.json()
+        returned_id = response_data["tuning_loop_id"]
+        poll_url = f"/tuning/{returned_id}"
+        
+        # Setup mock for polling
+        tuning_db_mocks.get_tuning_loop_by_id.return_value = {
+            "_id": returned_id,
+            "initial_prompt_id": valid_prompt_id,
+            "status": RUNNING,
+            "config": {
+                "target_score": 85.0,
+                "max_iterations": 3,
+                "scenario_weights": []
+            },
+            "iterations": [],
+            "final_prompt_id": None,
+            "created_at": "2025-10-04T10:00:00",
+            "updated_at": "2025-10-04T10:01:00"
+        }
+        
+        # Poll for status
+        poll_response = await app_client.get(poll_url)
+        
+        assert poll_response.status_code == status.HTTP_200_OK
+        poll_data = poll_response.json()
+        assert poll_data["_id"] == returned_id
+        assert poll_data["status"] == RUNNING
@@ -1,10 +1,20 @@
 """
 Unit tests for Tuning Service
 Tests the core logic functions for the Automated Tuning Loop module
+
+The classes share no state, so the module can be spread across workers with:
+pytest -n auto --dist loadfile test/test_tuning_service.py
+
+While fixing a failure, rerun just the last failures first with:
+pytest --lf test/test_tuning_service.py
 """
 
+import json
+import numpy
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from dataclasses import dataclass
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock
 from models.tuning_loop import (
     TuningStatus,
     ScenarioWeight,
@@ -22,45 +32,149 @@ from services.tuning_service import (
 )
 from bson import ObjectId
 
+# IDs and evaluation documents built once at import; the service only reads them
+EVAL1_ID = ObjectId()
+EVAL2_ID = ObjectId()
+SCENARIO1_ID = ObjectId()
+SCENARIO2_ID = ObjectId()
+
+MOCK_EVAL_1 = MappingProxyType({
+    "_id": EVAL1_ID,
+    "scenario_id": SCENARIO1_ID,
+    "status": "COMPLETED",
+    "scores": {
+        "task_completion": 80,
+        "conversation_efficiency": 70
+    }
+})
+MOCK_EVAL_2 = MappingProxyType({
+    "_id": EVAL2_ID,
+    "scenario_id": SCENARIO2_ID,
+    "status": "COMPLETED",
+    "scores": {
+        "task_completion": 60,
+        "conversation_efficiency": 80
+    }
+})
+MOCK_EVAL_SINGLE = MappingProxyType({
+    "_id": EVAL1_ID,
+    "scenario_id": SCENARIO1_ID,
+    "status": "COMPLETED",
+    "scores": {
+        "task_completion": 90,
+        "conversation_efficiency": 85
+    }
+})
+MOCK_EVAL_RUNNING = MappingProxyType({
+    "_id": EVAL1_ID,
+    "scenario_id": SCENARIO1_ID,
+    "status": "RUNNING",
+    "scores": None
+})
+
+
+@dataclass(frozen=True)
+class MockIds:
+    """ObjectIds shared by the database-backed tests"""
+    eval1: ObjectId
+    eval2: ObjectId
+    scenario1: ObjectId
+    scenario2: ObjectId
+
+
+@pytest.fixture(scope="module")
+def ids():
+    """The module's precomputed ObjectIds"""
+    return MockIds(eval1=EVAL1_ID, eval2=EVAL2_ID, scenario1=SCENARIO1_ID, scenario2=SCENARIO2_ID)
+
+
+@pytest.fixture(scope="module")
+def mock_generate():
+    """Patch the Gemini call once for the whole module"""
+    mock = AsyncMock()
+    # The monkeypatch fixture is function-scoped, so open a module-long context instead
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('services.tuning_service.generate_structured_content', mock)
+        yield mock
+
+
+@pytest.fixture(scope="module")
+def mock_evaluations_collection():
+    """One evaluations collection mock for the whole module, returned by the patched getter"""
+    collection = AsyncMock()
+    # Motor's find() and aggregate() are synchronous and return a cursor; only to_list() is awaited
+    collection.find = MagicMock()
+    collection.aggregate = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('services.tuning_service.get_evaluations_collection', lambda: collection)
+        yield collection
+
+
+@pytest.fixture(scope="module")
+def mock_scenarios_collection():
+    """Scenarios collection stand-in; the service only reads its name for the $lookup"""
+    collection = MagicMock()
+    collection.name = "scenarios"
+    # build_context_package imports the getter lazily, so patch it at the source
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('core.database.get_scenarios_collection', lambda: collection)
+        yield collection
+
+
+@pytest.fixture(autouse=True)
+def reset_module_mocks(mock_generate, mock_evaluations_collection):
+    """Clear calls and canned results left on the shared mocks by the previous test"""
+    # Reused rather than rebuilt: AsyncMock construction is the costly part
+    for mock in (mock_generate, mock_evaluations_collection):
+        mock.reset_mock(return_value=True, side_effect=True)
+
 
 class TestTuningLoopModels:
     """Test Pydantic models for TuningLoop"""
     
-    def test_scenario_weight_validation(self):
-        """Test ScenarioWeight model validation"""
-        # Valid weight
-        sw = ScenarioWeight(scenario_id="507f1f77bcf86cd799439012", weight=3)
-        assert sw.weight == 3
-        assert sw.scenario_id == "507f1f77bcf86cd799439012"
-        
+    @pytest.mark.parametrize("model_cls, kwargs, should_raise", [
+        pytest.param(ScenarioWeight, {"scenario_id": "507f1f77bcf86cd799439012", "weight": 3}, False, id="weight-valid"),
         # Weight must be 1-5
-        with pytest.raises(ValueError):
-            ScenarioWeight(scenario_id="507f1f77bcf86cd799439012", weight=0)
-        
-        with pytest.raises(ValueError):
-            ScenarioWeight(scenario_id="507f1f77bcf86cd799439012", weight=6)
-    
-    def test_tuning_config_validation(self):
-        """Test TuningConfig model validation"""
-        config = TuningConfig(
-            target_score=85.0,
-            max_iterations=5,
-            scenario_weights=[
+        pytest.param(ScenarioWeight, {"scenario_id": "507f1f77bcf86cd799439012", "weight": 0}, True, id="weight-too-low"),
+        pytest.param(ScenarioWeight, {"scenario_id": "507f1f77bcf86cd799439012", "weight": 6}, True, id="weight-too-high"),
+        pytest.param(TuningConfig, {
+            "target_score": 85.0,
+            "max_iterations": 5,
+            "scenario_weights": [
                 ScenarioWeight(scenario_id="scen1", weight=4),
                 ScenarioWeight(scenario_id="scen2", weight=3)
             ]
-        )
-        assert config.target_score == 85.0
-        assert config.max_iterations == 5
-        assert len(config.scenario_weights) == 2
-        
+        }, False, id="config-valid"),
         # Target score must be 0-100
-        with pytest.raises(ValueError):
-            TuningConfig(
-                target_score=150.0,
-                max_iterations=5,
-                scenario_weights=[]
-            )
+        pytest.param(TuningConfig, {
+            "target_score": 150.0,
+            "max_iterations": 5,
+            "scenario_weights": []
+        }, True, id="config-target-too-high"),
+        pytest.param(TuningLoopCreate, {
+            "initial_prompt_id": "prompt123",
+            "target_score": 85.0,
+            "max_iterations": 5,
+            "scenarios": [ScenarioWeight(scenario_id="scen1", weight=4)]
+        }, False, id="create-valid"),
+        # Scenarios must not be empty
+        pytest.param(TuningLoopCreate, {
+            "initial_prompt_id": "prompt123",
+            "target_score": 85.0,
+            "max_iterations": 5,
+            "scenarios": []
+        }, True, id="create-no-scenarios"),
+    ])
+    def test_model_validation(self, model_cls, kwargs, should_raise):
+        """Test field validation on ScenarioWeight, TuningConfig and TuningLoopCreate"""
+        if should_raise:
+            with pytest.raises(ValueError):
+                model_cls(**kwargs)
+            return
+        
+        model = model_cls(**kwargs)
+        for field, value in kwargs.items():
+            assert getattr(model, field) == value
     
     def test_tuning_iteration_model(self):
         """Test TuningIteration model"""
@@ -74,28 +188,6 @@ class TestTuningLoopModels:
         assert iteration.weighted_score == 78.5
         assert len(iteration.evaluation_ids) == 2
     
-    def test_tuning_loop_create_validation(self):
-        """Test TuningLoopCreate request model"""
-        create_request = TuningLoopCreate(
-            initial_prompt_id="prompt123",
-            target_score=85.0,
-            max_iterations=5,
-            scenarios=[
-                ScenarioWeight(scenario_id="scen1", weight=4)
-            ]
-        )
-        assert create_request.initial_prompt_id == "prompt123"
-        assert len(create_request.scenarios) == 1
-        
-        # Scenarios must not be empty
-        with pytest.raises(ValueError):
-            TuningLoopCreate(
-                initial_prompt_id="prompt123",
-                target_score=85.0,
-                max_iterations=5,
-                scenarios=[]
-            )
-    
     def test_tuning_loop_response_model(self):
         """Test TuningLoopResponse model"""
         from datetime import datetime
@@ -122,237 +214,190 @@ class TestTuningLoopModels:
         assert response.status == TuningStatus.COMPLETED
         assert response.final_prompt_id == "prompt2"
         assert len(response.iterations) == 1
+    
+    def test_models_smoke(self):
+        """Test every tuning model constructs cleanly in a tight loop"""
+        from datetime import datetime
+        
+        created_at = datetime.now()
+        for _ in range(1000):
+            weight = ScenarioWeight(scenario_id="scen1", weight=3)
+            config = TuningConfig(target_score=85.0, max_iterations=5, scenario_weights=[weight])
+            iteration = TuningIteration(
+                iteration_number=1,
+                prompt_id="prompt1",
+                evaluation_ids=["eval1"],
+                weighted_score=75.0
+            )
+            TuningLoopCreate(
+                initial_prompt_id="prompt1",
+                target_score=85.0,
+                max_iterations=5,
+                scenarios=[weight]
+            )
+            TuningLoopResponse(
+                _id="loop123",
+                status=TuningStatus.RUNNING,
+                config=config,
+                iterations=[iteration],
+                created_at=created_at
+            )
 
 
+@pytest.mark.asyncio
 class TestCalculateWeightedAverage:
     """Test calculate_weighted_average function"""
     
-    @pytest.mark.asyncio
-    async def test_calculate_weighted_average_basic(self):
+    async def test_calculate_weighted_average_basic(self, mock_evaluations_collection, ids):
         """Test basic weighted average calculation"""
-        # Create valid ObjectIds for testing
-        eval1_id = ObjectId()
-        eval2_id = ObjectId()
-        scenario1_id = ObjectId()
-        scenario2_id = ObjectId()
+        mock_evaluations_collection.find.return_value.to_list = AsyncMock(return_value=[MOCK_EVAL_1, MOCK_EVAL_2])
         
-        # Mock evaluation data
-        mock_evaluations = {
-            str(eval1_id): {
-                "_id": eval1_id,
-                "scenario_id": scenario1_id,
-                "status": "COMPLETED",
-                "scores": {
-                    "task_completion": 80,
-                    "conversation_efficiency": 70
-                }
-            },
-            str(eval2_id): {
-                "_id": eval2_id,
-                "scenario_id": scenario2_id,
-                "status": "COMPLETED",
-                "scores": {
-                    "task_completion": 60,
-                    "conversation_efficiency": 80
-                }
-            }
-        }
-        
-        # Mock collection
-        mock_collection = AsyncMock()
+        scenario_weights = [
+            ScenarioWeight(scenario_id=str(ids.scenario1), weight=4),
+            ScenarioWeight(scenario_id=str(ids.scenario2), weight=2)
+        ]
         
-        async def mock_find_one(query):
-            eval_id = str(query["_id"])
-            return mock_evaluations.get(eval_id)
+        # Expected calculation:
+        # Eval1: (80+70)/2 = 75, weighted = 75*4 = 300
+        # Eval2: (60+80)/2 = 70, weighted = 70*2 = 140
+        # Total: (300+140)/(4+2) = 440/6 = 73.33
         
-        mock_collection.find_one = mock_find_one
+        score = await calculate_weighted_average(
+            evaluation_ids=[str(ids.eval1), str(ids.eval2)],
+            scenario_weights=scenario_weights
+        )
         
-        with patch('services.tuning_service.get_evaluations_collection', return_value=mock_collection):
-            scenario_weights = [
-                ScenarioWeight(scenario_id=str(scenario1_id), weight=4),
-                ScenarioWeight(scenario_id=str(scenario2_id), weight=2)
-            ]
-            
-            # Expected calculation:
-            # Eval1: (80+70)/2 = 75, weighted = 75*4 = 300
-            # Eval2: (60+80)/2 = 70, weighted = 70*2 = 140
-            # Total: (300+140)/(4+2) = 440/6 = 73.33
-            
-            score = await calculate_weighted_average(
-                evaluation_ids=[str(eval1_id), str(eval2_id)],
-                scenario_weights=scenario_weights
-            )
-            
-            assert score == pytest.approx(73.33, rel=0.01)
+        # 440/6 rounded to 2 places by the service, so the float is exact
+        assert score == 73.33
+        # Both evaluations come back from a single query
+        mock_evaluations_collection.find.assert_called_once_with({"_id": {"$in": [ids.eval1, ids.eval2]}})
     
-    @pytest.mark.asyncio
-    async def test_calculate_weighted_average_single_evaluation(self):
+    async def test_calculate_weighted_average_single_evaluation(self, mock_evaluations_collection, ids):
         """Test weighted average with single evaluation"""
-        eval_id = ObjectId()
-        scenario_id = ObjectId()
+        mock_evaluations_collection.find.return_value.to_list = AsyncMock(return_value=[MOCK_EVAL_SINGLE])
         
-        mock_evaluation = {
-            "_id": eval_id,
-            "scenario_id": scenario_id,
-            "status": "COMPLETED",
-            "scores": {
-                "task_completion": 90,
-                "conversation_efficiency": 85
-            }
-        }
+        scenario_weights = [
+            ScenarioWeight(scenario_id=str(ids.scenario1), weight=3)
+        ]
         
-        mock_collection = AsyncMock()
-        mock_collection.find_one.return_value = mock_evaluation
+        # Expected: (90+85)/2 = 87.5
+        score = await calculate_weighted_average(
+            evaluation_ids=[str(ids.eval1)],
+            scenario_weights=scenario_weights
+        )
         
-        with patch('services.tuning_service.get_evaluations_collection', return_value=mock_collection):
-            scenario_weights = [
-                ScenarioWeight(scenario_id=str(scenario_id), weight=3)
-            ]
-            
-            # Expected: (90+85)/2 = 87.5
-            score = await calculate_weighted_average(
-                evaluation_ids=[str(eval_id)],
-                scenario_weights=scenario_weights
-            )
-            
-            assert score == 87.5
+        assert score == 87.5
     
-    @pytest.mark.asyncio
-    async def test_calculate_weighted_average_evaluation_not_found(self):
+    async def test_calculate_weighted_average_matches_numpy(self, mock_evaluations_collection):
+        """Test the weighted average agrees with numpy.average as a reference"""
+        scores = [(80, 70), (60, 80), (95, 40), (33, 67)]
+        weights = [4, 2, 5, 1]
+        
+        mock_evaluations = []
+        scenario_weights = []
+        for (task, efficiency), weight in zip(scores, weights):
+            scenario_id = ObjectId()
+            mock_evaluations.append({
+                "_id": ObjectId(),
+                "scenario_id": scenario_id,
+                "status": "COMPLETED",
+                "scores": {
+                    "task_completion": task,
+                    "conversation_efficiency": efficiency
+                }
+            })
+            scenario_weights.append(ScenarioWeight(scenario_id=str(scenario_id), weight=weight))
+        
+        mock_evaluations_collection.find.return_value.to_list = AsyncMock(return_value=mock_evaluations)
+        
+        score = await calculate_weighted_average(
+            evaluation_ids=[str(e["_id"]) for e in mock_evaluations],
+            scenario_weights=scenario_weights
+        )
+        
+        expected = numpy.average([sum(pair) / 2.0 for pair in scores], weights=weights)
+        assert score == round(float(expected), 2)
+    
+    async def test_calculate_weighted_average_evaluation_not_found(self, mock_evaluations_collection, ids):
         """Test error when evaluation not found"""
-        eval_id = ObjectId()
+        mock_evaluations_collection.find.return_value.to_list = AsyncMock(return_value=[])
         
-        mock_collection = AsyncMock()
-        mock_collection.find_one.return_value = None
+        scenario_weights = [
+            ScenarioWeight(scenario_id="507f1f77bcf86cd799439012", weight=3)
+        ]
         
-        with patch('services.tuning_service.get_evaluations_collection', return_value=mock_collection):
-            scenario_weights = [
-                ScenarioWeight(scenario_id="507f1f77bcf86cd799439012", weight=3)
-            ]
-            
-            with pytest.raises(ValueError, match="Evaluation not found"):
-                await calculate_weighted_average(
-                    evaluation_ids=[str(eval_id)],
-                    scenario_weights=scenario_weights
-                )
+        with pytest.raises(ValueError, match="Evaluation not found"):
+            await calculate_weighted_average(
+                evaluation_ids=[str(ids.eval1)],
+                scenario_weights=scenario_weights
+            )
     
-    @pytest.mark.asyncio
-    async def test_calculate_weighted_average_incomplete_evaluation(self):
+    async def test_calculate_weighted_average_incomplete_evaluation(self, mock_evaluations_collection, ids):
         """Test error when evaluation not completed"""
-        eval_id = ObjectId()
-        scenario_id = ObjectId()
-        
-        mock_evaluation = {
-            "_id": eval_id,
-            "scenario_id": scenario_id,
-            "status": "RUNNING",
-            "scores": None
-        }
+        mock_evaluations_collection.find.return_value.to_list = AsyncMock(return_value=[MOCK_EVAL_RUNNING])
         
-        mock_collection = AsyncMock()
-        mock_collection.find_one.return_value = mock_evaluation
+        scenario_weights = [
+            ScenarioWeight(scenario_id=str(ids.scenario1), weight=3)
+        ]
         
-        with patch('services.tuning_service.get_evaluations_collection', return_value=mock_collection):
-            scenario_weights = [
-                ScenarioWeight(scenario_id=str(scenario_id), weight=3)
-            ]
-            
-            with pytest.raises(ValueError, match="is not completed"):
-                await calculate_weighted_average(
-                    evaluation_ids=[str(eval_id)],
-                    scenario_weights=scenario_weights
-                )
+        with pytest.raises(ValueError, match="is not completed"):
+            await calculate_weighted_average(
+                evaluation_ids=[str(ids.eval1)],
+                scenario_weights=scenario_weights
+            )
 
 
+@pytest.mark.asyncio
 class TestWriterCritiqueCycle:
     """Test run_writer_critique_cycle function"""
     
-    @pytest.mark.asyncio
-    async def test_writer_critique_cycle_success_first_try(self):
-        """Test successful Writer-Critique cycle on first attempt"""
-        context = """
-        CURRENT PROMPT: You are a debt collector...
-        TARGET SCORE: 85
-        FAILED EVALUATIONS: Agent was too aggressive...
-        """
-        
-        # Mock responses
-        writer_response = {"system_prompt": "Improved prompt with more empathy..."}
-        critique_response = {"feedback": "Looks good!", "pass": True}
-        
-        with patch('services.tuning_service.generate_structured_content') as mock_generate:
-            # First call: Writer, Second call: Critique
-            mock_generate.side_effect = [writer_response, critique_response]
-            
-            result = await run_writer_critique_cycle(context)
-            
-            assert result == "Improved prompt with more empathy..."
-            assert mock_generate.call_count == 2
-    
-    @pytest.mark.asyncio
-    async def test_writer_critique_cycle_revision_needed(self):
-        """Test Writer-Critique cycle with revision"""
+    @pytest.mark.parametrize("responses, max_cycles, expected, calls", [
+        # Critique approves the first draft: Writer, Critique
+        pytest.param([
+            {"system_prompt": "Improved prompt with more empathy..."},
+            {"feedback": "Looks good!", "pass": True}
+        ], 3, "Improved prompt with more empathy...", 2, id="success-first-try"),
+        # First critique fails, second passes: Writer, Critique, Writer, Critique
+        pytest.param([
+            {"system_prompt": "First attempt..."},
+            {"feedback": "Too vague", "pass": False},
+            {"system_prompt": "Revised attempt..."},
+            {"feedback": "Better!", "pass": True}
+        ], 3, "Revised attempt...", 4, id="revision-needed"),
+        # Critique never passes: the last attempt is returned anyway
+        pytest.param([
+            {"system_prompt": "Attempt..."},
+            {"feedback": "Not good enough", "pass": False},
+            {"system_prompt": "Attempt..."},
+            {"feedback": "Not good enough", "pass": False}
+        ], 2, "Attempt...", 4, id="max-cycles-reached"),
+    ])
+    async def test_writer_critique_cycle(self, mock_generate, responses, max_cycles, expected, calls):
+        """Test the Writer-Critique cycle across approval, revision and exhaustion"""
         context = "CURRENT PROMPT: Basic prompt..."
         
-        # Mock responses - first critique fails, second passes
-        writer_response_1 = {"system_prompt": "First attempt..."}
-        critique_response_1 = {"feedback": "Too vague", "pass": False}
-        writer_response_2 = {"system_prompt": "Revised attempt..."}
-        critique_response_2 = {"feedback": "Better!", "pass": True}
-        
-        with patch('services.tuning_service.generate_structured_content') as mock_generate:
-            mock_generate.side_effect = [
-                writer_response_1,
-                critique_response_1,
-                writer_response_2,
-                critique_response_2
-            ]
-            
-            result = await run_writer_critique_cycle(context, max_critique_cycles=3)
-            
-            assert result == "Revised attempt..."
-            assert mock_generate.call_count == 4  # Writer, Critique, Writer, Critique
-    
-    @pytest.mark.asyncio
-    async def test_writer_critique_cycle_max_cycles_reached(self):
-        """Test Writer-Critique cycle when max cycles reached"""
-        context = "CURRENT PROMPT: Basic prompt..."
+        # generate_structured_content returns the model's raw JSON text
+        mock_generate.side_effect = [json.dumps(response) for response in responses]
         
-        # Mock responses - always fail critique
-        writer_response = {"system_prompt": "Attempt..."}
-        critique_response = {"feedback": "Not good enough", "pass": False}
+        result = await run_writer_critique_cycle(context, max_critique_cycles=max_cycles)
         
-        with patch('services.tuning_service.generate_structured_content') as mock_generate:
-            mock_generate.side_effect = [
-                writer_response,
-                critique_response,
-                writer_response,
-                critique_response,
-            ]
-            
-            result = await run_writer_critique_cycle(context, max_critique_cycles=2)
-            
-            # Should return the last attempt even if not approved
-            assert result == "Attempt..."
-            assert mock_generate.call_count == 4
+        assert result == expected
+        assert mock_generate.call_count == calls
 
 
+@pytest.mark.asyncio
 class TestBuildContextPackage:
     """Test build_context_package function"""
     
-    @pytest.mark.asyncio
-    async def test_build_context_package_basic(self):
+    async def test_build_context_package_basic(self, mock_evaluations_collection, mock_scenarios_collection, ids):
         """Test building context package with evaluations"""
         current_prompt = "You are a debt collector..."
         target_score = 85.0
         
-        eval_id = ObjectId()
-        scenario_id = ObjectId()
-        
         # Mock evaluation
         mock_evaluation = {
-            "_id": eval_id,
-            "scenario_id": scenario_id,
+            "_id": ids.eval1,
+            "scenario_id": ids.scenario1,
             "scores": {
                 "task_completion": 60,
                 "conversation_efficiency": 70
@@ -366,38 +411,41 @@ class TestBuildContextPackage:
         
         # Mock scenario
         mock_scenario = {
-            "_id": scenario_id,
+            "_id": ids.scenario1,
             "title": "Anxious Debtor",
             "objective": "Avoid payment"
         }
         
-        mock_eval_collection = AsyncMock()
-        mock_eval_collection.find_one.return_value = mock_evaluation
+        # The aggregation joins the scenario onto its evaluation
+        mock_evaluations_collection.aggregate.return_value.to_list = AsyncMock(
+            return_value=[{**mock_evaluation, "scenario": [mock_scenario]}]
+        )
+        
+        scenario_weights = [
+            ScenarioWeight(scenario_id=str(ids.scenario1), weight=4)
+        ]
         
-        mock_scenario_collection = AsyncMock()
-        mock_scenario_collection.find_one.return_value = mock_scenario
+        context = await build_context_package(
+            current_prompt_text=current_prompt,
+            target_score=target_score,
+            failed_evaluation_ids=[str(ids.eval1)],
+            scenario_weights=scenario_weights
+        )
         
-        with patch('services.tuning_service.get_evaluations_collection', return_value=mock_eval_collection), \
-             patch('core.database.get_scenarios_collection', return_value=mock_scenario_collection):
-            
-            scenario_weights = [
-                ScenarioWeight(scenario_id=str(scenario_id), weight=4)
-            ]
-            
-            context = await build_context_package(
-                current_prompt_text=current_prompt,
-                target_score=target_score,
-                failed_evaluation_ids=[str(eval_id)],
-                scenario_weights=scenario_weights
-            )
-            
-            # Verify context contains key information
-            assert "You are a debt collector..." in context
-            assert "TARGET SCORE: 85.0" in context
-            assert "Anxious Debtor" in context
-            assert "Agent was too pushy" in context
-            assert "AGENT: You need to pay now!" in context
-            assert "DEBTOR: I can't afford it." in context
+        # Verify context contains key information
+        assert "You are a debt collector..." in context
+        assert "TARGET SCORE: 85.0" in context
+        assert "Anxious Debtor" in context
+        assert "Agent was too pushy" in context
+        assert "AGENT: You need to pay now!" in context
+        assert "DEBTOR: I can't afford it." in context
+        # Evaluations and scenarios come back from a single aggregation
+        mock_evaluations_collection.aggregate.assert_called_once()
+        (pipeline,), _ = mock_evaluations_collection.aggregate.call_args
+        lookup = pipeline[1]["$lookup"]
+        assert lookup["from"] == mock_scenarios_collection.name
+        # A malformed scenario_id must not fail the aggregation
+        assert lookup["let"]["scenario_id"]["$convert"]["onError"] is None
 
 
 class TestSchemaCreation:
@@ -414,6 +462,11 @@ class TestSchemaCreation:
         schema = create_critique_schema()
         assert schema is not None
         # Schema should have feedback and pass properties
+    
+    def test_schemas_are_cached(self):
+        """Test that the static schemas are built once and reused"""
+        assert create_writer_schema() is create_writer_schema()
+        assert create_critique_schema() is create_critique_schema()
 
 
 if __name__ == "__main__":